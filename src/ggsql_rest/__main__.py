@@ -75,13 +75,23 @@ def main() -> None:
             if snowflake_databases_str
             else None
         )
+        snowflake_schemas_str = os.environ.get("SNOWFLAKE_SCHEMAS")
+        snowflake_schemas = (
+            [s.strip() for s in snowflake_schemas_str.split(",") if s.strip()]
+            if snowflake_schemas_str
+            else None
+        )
         snowflake = SnowflakeDiscovery(
             account=snowflake_account,
             warehouse=snowflake_warehouse,
             connection_name=os.environ.get("SNOWFLAKE_CONNECTION_NAME"),
             databases=snowflake_databases,
+            schemas=snowflake_schemas,
+            cache_dir=os.environ.get("SNOWFLAKE_CACHE_DIR") or None,
         )
         db_msg = f", databases: {','.join(snowflake_databases)}" if snowflake_databases else ""
+        if snowflake_schemas:
+            db_msg += f", schemas: {','.join(snowflake_schemas)}"
         print(f"Snowflake discovery enabled (account: {snowflake_account}{db_msg})")
     elif snowflake_account or snowflake_warehouse:
         print(
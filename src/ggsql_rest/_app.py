@@ -11,6 +11,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from ._connections import ConnectionRegistry
 from ._sessions import SessionManager
 from ._errors import register_error_handlers
+from ._responses import OrjsonResponse
 from ._routes import _health, _sessions, _query, _schema
 
 if TYPE_CHECKING:
@@ -50,6 +51,7 @@ def create_app(
     app = FastAPI(
         title="ggsql REST API",
         description="REST API server for ggsql with SQLAlchemy backend support",
+        default_response_class=OrjsonResponse,
         lifespan=_make_lifespan(registry, session_manager, snowflake),
     )
 
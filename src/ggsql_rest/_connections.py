@@ -65,6 +65,16 @@ class ConnectionRegistry:
         """Get the provider type for a connection, or None if unknown."""
         return self._providers.get(name)
 
+    def clear(self) -> None:
+        """Forget all registered connections and cached engines.
+
+        Cached engines are dropped without being disposed; call
+        ``dispose_all()`` first if they should be released as well.
+        """
+        self._factories.clear()
+        self._providers.clear()
+        self._engines.clear()
+
     def dispose_all(self) -> None:
         """Dispose all cached engines. Called on shutdown."""
         for engine in self._engines.values():
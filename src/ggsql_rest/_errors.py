@@ -1,7 +1,8 @@
 """Error handling utilities."""
 
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+
+from ._responses import OrjsonResponse
 
 
 class ApiError(Exception):
@@ -33,8 +34,8 @@ def register_error_handlers(app: FastAPI) -> None:
     """Register error handlers on the FastAPI app."""
 
     @app.exception_handler(ApiError)
-    async def handle_api_error(request: Request, exc: ApiError) -> JSONResponse:
-        return JSONResponse(
+    async def handle_api_error(request: Request, exc: ApiError) -> OrjsonResponse:
+        return OrjsonResponse(
             status_code=exc.status_code,
             content={
                 "status": "error",
@@ -43,8 +44,8 @@ def register_error_handlers(app: FastAPI) -> None:
         )
 
     @app.exception_handler(ValueError)
-    async def handle_value_error(request: Request, exc: ValueError) -> JSONResponse:
-        return JSONResponse(
+    async def handle_value_error(request: Request, exc: ValueError) -> OrjsonResponse:
+        return OrjsonResponse(
             status_code=400,
             content={
                 "status": "error",
@@ -53,8 +54,8 @@ def register_error_handlers(app: FastAPI) -> None:
         )
 
     @app.exception_handler(KeyError)
-    async def handle_key_error(request: Request, exc: KeyError) -> JSONResponse:
-        return JSONResponse(
+    async def handle_key_error(request: Request, exc: KeyError) -> OrjsonResponse:
+        return OrjsonResponse(
             status_code=400,
             content={
                 "status": "error",
@@ -1,9 +1,9 @@
 """Query execution with hybrid local/remote support."""
 
-import json
 import uuid
 from typing import Any
 
+import orjson
 import polars as pl
 from sqlalchemy import Engine, text
 
@@ -63,7 +63,7 @@ def execute_ggsql(
     vegalite_json = writer.render(spec)
 
     return {
-        "spec": json.loads(vegalite_json),
+        "spec": orjson.loads(vegalite_json),
         "metadata": {
             "rows": spec.metadata()["rows"],
             "columns": spec.metadata()["columns"],
@@ -0,0 +1,17 @@
+"""Response classes."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class OrjsonResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    Stand-in for FastAPI's ``ORJSONResponse``, which is deprecated in newer
+    FastAPI releases.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
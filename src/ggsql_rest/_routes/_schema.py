@@ -1,7 +1,6 @@
 """Schema introspection route."""
 
-import json
-
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import StreamingResponse
 
@@ -55,7 +54,7 @@ async def schema_tables(
         # First line: local + remote tables
         if local_tables:
             line = {"tables": [t.model_dump(by_alias=True) for t in local_tables]}
-            yield json.dumps(line) + "\n"
+            yield orjson.dumps(line) + b"\n"
 
         # Subsequent lines: Snowflake tables per-database
         if snowflake is not None and not skip_snowflake:
@@ -65,7 +64,7 @@ async def schema_tables(
                     for tn, cn in batch
                 ]
                 line = {"tables": [e.model_dump(by_alias=True) for e in entries]}
-                yield json.dumps(line) + "\n"
+                yield orjson.dumps(line) + b"\n"
 
     return StreamingResponse(generate(), media_type="application/x-ndjson")
 
@@ -98,7 +97,7 @@ async def schema(
     # Snowflake tables (if configured and not skipped)
     if snowflake is not None and not skip_snowflake:
         snowflake_tables = snowflake.get_tables(request, include_stats)
-        tables.extend(snowflake_tables)
+        tables.extend(snowflake_tables.values())
 
     return success_envelope(SchemaResponse(tables=tables))
 
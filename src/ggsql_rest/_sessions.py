@@ -18,7 +18,7 @@ class Session:
     def __init__(self, session_id: str, timeout_mins: int = 30):
         self.id = session_id
         self.created_at = datetime.now(timezone.utc)
-        self.last_accessed = datetime.now(timezone.utc)
+        self.last_accessed = self.created_at
         self.timeout = timedelta(minutes=timeout_mins)
         self.duckdb = DuckDBReader("duckdb://memory")
         self.tables: list[str] = []
@@ -27,9 +27,11 @@ class Session:
         """Update last accessed time."""
         self.last_accessed = datetime.now(timezone.utc)
 
-    def is_expired(self) -> bool:
-        """Check if session has expired."""
-        return datetime.now(timezone.utc) - self.last_accessed > self.timeout
+    def is_expired(self, now: datetime | None = None) -> bool:
+        """Check if session has expired (as of ``now``, default current time)."""
+        if now is None:
+            now = datetime.now(timezone.utc)
+        return now - self.last_accessed > self.timeout
 
 
 class SessionManager:
@@ -72,7 +74,8 @@ class SessionManager:
 
     def cleanup_expired(self) -> None:
         """Remove all expired sessions."""
-        expired = [sid for sid, s in self._sessions.items() if s.is_expired()]
+        now = datetime.now(timezone.utc)
+        expired = [sid for sid, s in self._sessions.items() if s.is_expired(now)]
         for sid in expired:
             del self._sessions[sid]
 
@@ -8,18 +8,34 @@ Supports two auth modes:
 
 from __future__ import annotations
 
-import json
-from collections import OrderedDict
-from typing import TYPE_CHECKING
-
+import hashlib
+import os
+import re
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple, Protocol, TypeVar, overload
+
+import orjson
 import snowflake.connector as snowflake_connector
 from sqlalchemy import create_engine
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import (
+        Callable,
+        Container,
+        Iterable,
+        Iterator,
+        Mapping,
+    )
 
-    from fastapi import Request
     from snowflake.connector import SnowflakeConnection
+    from snowflake.connector.cursor import SnowflakeCursor
     from sqlalchemy import Engine
 
     from ._models import ColumnSchema, TableSchema
@@ -32,32 +48,295 @@ except ImportError:
 
 _SESSION_TOKEN_HEADER = "posit-connect-user-session-token"
 
+# Snowflake access tokens minted through Connect live for 10 minutes; reuse
+# them per session token and re-mint a minute before they expire
+_OAUTH_TOKEN_LIFETIME = 600.0
+_OAUTH_TOKEN_TTL = _OAUTH_TOKEN_LIFETIME - 60.0
+
+# Age after which an on-disk catalog (see SnowflakeDiscovery.cache_dir) is
+# ignored and the catalog is rediscovered
+_DISK_CATALOG_TTL = 3600.0
+
+# Upper bound on databases discovered concurrently (one cursor per worker)
+_MAX_DISCOVERY_WORKERS = 8
+
+# Rows per fetchmany() call when streaming SHOW / INFORMATION_SCHEMA results
+_FETCH_BATCH = 999
+
+# Most rows a single SHOW returns; longer results are silently truncated
+_SHOW_MAX_ROWS = 10_000
+
+# Rows per SHOW ... LIMIT page, safely below _SHOW_MAX_ROWS
+_SHOW_PAGE = 9000
+
+_T = TypeVar("_T")
+_D = TypeVar("_D")
+
+# Schemas never listed as connections (Snowflake's metadata views). This is
+# the only place to change: every discovery path, including the SQL filter
+# in _TABLES_QUERY, checks membership in this set.
+_SKIP_SCHEMAS = frozenset({"INFORMATION_SCHEMA"})
+
+# Query templates; identifiers are passed through _quote_identifier().
+# _TABLES_QUERY needs a running warehouse; _SHOW_TABLES is its fallback, and
+# per-schema SHOW TERSE TABLES covers databases where that SHOW fails or is
+# truncated. Single-level SHOWs are paged with _show_paginated(); multi-level
+# ones (_SHOW_ACCOUNT_OBJECTS, _SHOW_TABLES) go through _show_complete().
+_TABLES_QUERY = (
+    "SELECT table_schema, table_name "
+    "FROM {}.INFORMATION_SCHEMA.TABLES "
+    "WHERE table_schema NOT IN ("
+    + ", ".join(f"'{schema}'" for schema in sorted(_SKIP_SCHEMAS))
+    + ") "
+    "AND table_type IN ('BASE TABLE', 'TEMPORARY TABLE') "
+    "ORDER BY table_schema, table_name"
+)
+_SHOW_ACCOUNT_OBJECTS = "SHOW TERSE OBJECTS IN ACCOUNT"
+_SHOW_TABLES = "SHOW TERSE TABLES IN DATABASE {}"
+_SHOW_SCHEMAS = "SHOW TERSE SCHEMAS IN DATABASE {}"
+_SHOW_SCHEMA_TABLES = "SHOW TERSE TABLES IN SCHEMA {}.{}"
+_SHOW_DATABASE_COLUMNS = "SHOW COLUMNS IN DATABASE {}"
+_SHOW_ACCOUNT_COLUMNS = "SHOW COLUMNS IN ACCOUNT"
+_SHOW_TABLE_COLUMNS = "SHOW COLUMNS IN TABLE {}.{}.{}"
+
+# SHOW OBJECTS kinds that are tables (views and other objects are skipped)
+_TABLE_KINDS = frozenset({"TABLE", "TEMPORARY", "TRANSIENT"})
+
+_QUOTE_ESCAPES = str.maketrans({'"': '""'})
+_LITERAL_ESCAPES = str.maketrans({"\\": "\\\\", "'": "\\'"})
+
+
+def _iter_rows(cursor: SnowflakeCursor) -> Iterator[tuple]:
+    """Yield a cursor's result rows in fetchmany() batches.
+
+    Lets callers project the columns they need as rows arrive, rather than
+    holding the full SHOW output in memory.
+    """
+    for batch in iter(lambda: cursor.fetchmany(_FETCH_BATCH), []):
+        yield from batch
+
+
+def _quote_identifier(name: str) -> str:
+    """Double-quote a Snowflake identifier, doubling any embedded quotes."""
+    return '"' + name.translate(_QUOTE_ESCAPES) + '"'
+
+
+def _quote_literal(value: str) -> str:
+    """Single-quote a Snowflake string literal, escaping quotes and backslashes."""
+    return "'" + value.translate(_LITERAL_ESCAPES) + "'"
+
+
+def _show_paginated(
+    cursor: SnowflakeCursor,
+    query: str,
+    page: int = _SHOW_PAGE,
+    first_page: list[tuple] | None = None,
+) -> Iterator[tuple]:
+    """Run a SHOW query in ``LIMIT page FROM 'name'`` pages, yielding every row.
+
+    A single SHOW returns at most _SHOW_MAX_ROWS rows, so the query is
+    re-issued from the last name seen (column 1) until a short page comes
+    back. FROM starts at the matching name, so that row is skipped when it
+    reappears. Only valid for single-level scopes (SHOW DATABASES, SCHEMAS
+    IN DATABASE, TABLES IN SCHEMA), whose rows are unique by name and sorted
+    by it alone; scopes sorted by database or schema first use
+    _show_complete().
+
+    ``first_page`` holds the rows of a ``LIMIT page`` query that was already
+    run (e.g. with execute_async); paging then continues after it.
+    """
+    name: str | None = None
+    while True:
+        if first_page is not None:
+            rows: Iterable[tuple] = first_page
+            first_page = None
+        else:
+            paged = f"{query} LIMIT {page}"
+            if name is not None:
+                paged += f" FROM {_quote_literal(name)}"
+            cursor.execute(paged)
+            rows = _iter_rows(cursor)
+
+        count = 0
+        last = name
+        for row in rows:
+            count += 1
+            if row[1] == name:
+                continue  # Last row of the previous page
+            last = row[1]
+            yield row
+
+        if count < page or last == name:
+            return
+        name = last
+
+
+def _show_complete(cursor: SnowflakeCursor, query: str) -> list[tuple] | None:
+    """Run a SHOW query in one go, or return None if it may be truncated.
+
+    For multi-level scopes (e.g. TABLES IN DATABASE, sorted by schema and
+    then name), where ``LIMIT ... FROM 'name'`` can't resume a page. A result
+    of _SHOW_MAX_ROWS rows may have been cut short, so callers fall back to
+    narrower queries.
+    """
+    cursor.execute(query)
+    rows = list(_iter_rows(cursor))
+    if len(rows) >= _SHOW_MAX_ROWS:
+        return None
+    return rows
+
+
+# Snowflake type names spelled differently in SQL. Everything else (DATE,
+# BOOLEAN, TIMESTAMP_NTZ, TIMESTAMP_LTZ, TIMESTAMP_TZ, TIME, BINARY, VARIANT,
+# OBJECT, ARRAY) is used as-is; FIXED becomes NUMBER(precision,scale).
+_TYPE_MAP = {"TEXT": "VARCHAR", "REAL": "FLOAT"}
+
+# FIXED data_type JSON in the exact shape SHOW COLUMNS emits it
+_FIXED_RE = re.compile(r'\{"type":"FIXED","precision":(\d+),"scale":(\d+)[,}]')
 
+
+@lru_cache(maxsize=4096)
 def _parse_snowflake_type(data_type_json: str) -> str:
     """Parse Snowflake's JSON data_type string into a readable type name.
 
     SHOW COLUMNS returns data_type as JSON, e.g.:
       {"type":"FIXED","precision":38,"scale":0,"nullable":true}
+
+    FIXED, the most common type, is matched with a regex anchored to the
+    top-level object; anything else is parsed with orjson. Results are
+    memoized, as a catalog repeats a handful of distinct data_type strings
+    many times.
     """
+    if isinstance(data_type_json, str):
+        match = _FIXED_RE.match(data_type_json)
+        if match:
+            return f"NUMBER({match[1]},{match[2]})"
+
     try:
-        parsed = json.loads(data_type_json)
-    except (json.JSONDecodeError, TypeError):
+        parsed = orjson.loads(data_type_json)
+    except orjson.JSONDecodeError:
+        return "VARCHAR"
+    if not isinstance(parsed, dict):
         return "VARCHAR"
 
     sf_type = parsed.get("type", "VARCHAR")
+    if not isinstance(sf_type, str):
+        return "VARCHAR"
 
     if sf_type == "FIXED":
         precision = parsed.get("precision", 38)
         scale = parsed.get("scale", 0)
         return f"NUMBER({precision},{scale})"
-    elif sf_type == "TEXT":
-        return "VARCHAR"
-    elif sf_type == "REAL":
-        return "FLOAT"
-    else:
-        # DATE, BOOLEAN, TIMESTAMP_NTZ, TIMESTAMP_LTZ, TIMESTAMP_TZ,
-        # TIME, BINARY, VARIANT, OBJECT, ARRAY — use as-is
-        return sf_type
+    return _TYPE_MAP.get(sf_type, sf_type)
+
+
+def _add_column_rows(
+    columns: defaultdict[tuple[str, str, str], list[tuple[str, str]]],
+    rows: Iterable[tuple],
+    databases: Container[str],
+) -> int:
+    """Group SHOW COLUMNS rows into ``columns`` by (database, schema, table).
+
+    Rows are (table_name, schema_name, column_name, data_type, ..., and
+    database_name at index 9). Rows outside ``databases`` or in
+    _SKIP_SCHEMAS are ignored. Returns the number of rows read, ignored
+    ones included.
+    """
+    count = 0
+    for count, row in enumerate(rows, 1):
+        table_name, schema_name, col_name, data_type_json = row[:4]
+        db_name = row[9]
+        if db_name not in databases or schema_name in _SKIP_SCHEMAS:
+            continue
+
+        columns[db_name, schema_name, table_name].append(
+            (col_name, _parse_snowflake_type(data_type_json))
+        )
+    return count
+
+
+class _HeaderCarrier(Protocol):
+    """Anything with request headers, e.g. a FastAPI ``Request``.
+
+    Discovery only reads auth and user headers (lowercase keys). Declared as
+    a read-only property so Starlette's ``Headers`` property satisfies it.
+    """
+
+    @property
+    def headers(self) -> Mapping[str, str]: ...
+
+
+class _ConnInfo(NamedTuple):
+    """Location of a discovered DATABASE.SCHEMA connection."""
+
+    database: str
+    schema: str
+
+
+class _TimedCache(OrderedDict[str, _T]):
+    """LRU dict of at most ``maxsize`` keys that timestamps each assignment.
+
+    Reads mark a key as recently used; inserting past ``maxsize`` evicts the
+    least recently used key. Ages use the monotonic clock.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        super().__init__()
+        self.maxsize = maxsize
+        self._stored_at: dict[str, float] = {}
+        self._lock = threading.RLock()
+
+    def __getitem__(self, key: str) -> _T:
+        with self._lock:
+            value = super().__getitem__(key)
+            self.move_to_end(key)
+            return value
+
+    @overload
+    def get(self, key: str, default: None = None, /) -> _T | None: ...
+    @overload
+    def get(self, key: str, default: _T, /) -> _T: ...
+    @overload
+    def get(self, key: str, default: _D, /) -> _T | _D: ...
+
+    def get(self, key, default=None, /):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def get_with_age(self, key: str) -> tuple[_T, float] | None:
+        """Return ``(value, age)`` for ``key`` in one locked step, or None.
+
+        Unlike a membership test followed by separate reads, the entry can't
+        be evicted by another thread in between.
+        """
+        with self._lock:
+            if not super().__contains__(key):
+                return None
+            return self[key], self.age(key)
+
+    def __setitem__(self, key: str, value: _T) -> None:
+        with self._lock:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            self._stored_at[key] = time.monotonic()
+            while len(self) > self.maxsize:
+                del self[next(iter(self))]
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            super().__delitem__(key)
+            del self._stored_at[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            super().clear()
+            self._stored_at.clear()
+
+    def age(self, key: str) -> float:
+        """Seconds since ``key`` was last assigned."""
+        return time.monotonic() - self._stored_at[key]
 
 
 class SnowflakeDiscovery:
@@ -68,6 +347,14 @@ class SnowflakeDiscovery:
         warehouse: Default warehouse for queries.
         connection_name: Optional name in ~/.snowflake/connections.toml (local dev).
         databases: Optional list of database names to discover. If None, discovers all.
+        schemas: Optional list of "DATABASE.SCHEMA" names to discover. If set,
+            only these schemas are listed, without SHOW DATABASES or SHOW SCHEMAS.
+        cache_ttl: Seconds before a user's cached table schemas are stale. Stale
+            schemas are still served while a background refresh runs.
+        cache_maxsize: Maximum number of users whose catalog, connections, and
+            table schemas are cached; the least recently used user is evicted.
+        cache_dir: Optional directory for persisting each user's table-name
+            catalog as JSON, so new workers can skip discovery for up to an hour.
     """
 
     def __init__(
@@ -76,34 +363,70 @@ class SnowflakeDiscovery:
         warehouse: str,
         connection_name: str | None = None,
         databases: list[str] | None = None,
+        schemas: list[str] | None = None,
+        cache_ttl: float = 600.0,
+        cache_maxsize: int = 256,
+        cache_dir: str | os.PathLike[str] | None = None,
     ):
         self.account = account
         self.warehouse = warehouse
         self.connection_name = connection_name
         self.databases = databases
-
-        # Per-user caches: user_id -> discovered connections
-        self._discovered_connections: dict[str, dict[str, tuple[str, str]]] = {}
-        # Per-user caches: user_id -> discovered tables
-        self._discovered_tables: dict[str, list[TableSchema]] = {}
+        self.schemas = schemas
+        # Configured schemas grouped by database: db -> [schema, ...]
+        self._schemas_by_database: dict[str, list[str]] = {}
+        for qualified in schemas or ():
+            db_name, _, schema_name = qualified.partition(".")
+            if not db_name or not schema_name:
+                raise ValueError(
+                    f"Invalid Snowflake schema {qualified!r}; expected DATABASE.SCHEMA"
+                )
+            self._schemas_by_database.setdefault(db_name, []).append(schema_name)
+        self.cache_ttl = cache_ttl
+        self.cache_maxsize = cache_maxsize
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+
+        # Per-user caches (LRU-bounded): user_id -> discovered connections
+        self._discovered_connections: _TimedCache[dict[str, _ConnInfo]] = (
+            _TimedCache(cache_maxsize)
+        )
+        # Per-user caches: user_id -> "DATABASE.SCHEMA.TABLE" -> table schema,
+        # timestamped for the TTL
+        self._discovered_tables: _TimedCache[dict[str, TableSchema]] = _TimedCache(
+            cache_maxsize
+        )
+        # Users whose stale tables are being refreshed in the background
+        self._refreshing: set[str] = set()
+        self._refresh_lock = threading.Lock()
+        # OAuth cache: session token -> (expires_at, authenticator, token)
+        self._oauth_credentials: dict[str, tuple[float, str | None, str | None]] = {}
         # Per-user catalog cache: user_id -> list of (conn_name, db, schema, table_name)
-        self._discovered_catalog: dict[str, list[tuple[str, str, str, str]]] = {}
+        self._discovered_catalog: _TimedCache[list[tuple[str, str, str, str]]] = (
+            _TimedCache(cache_maxsize)
+        )
+        # Discovery connection pool: user_id -> open keep-alive connection
+        self._connections: dict[str, SnowflakeConnection] = {}
+        self._connections_lock = threading.Lock()
         # Engine cache: (user_id, connection_name) -> Engine
         self._engines: OrderedDict[tuple[str, str], Engine] = OrderedDict()
         self._max_engines = 50
 
     def _create_connection(
         self,
-        request: Request,
+        request: _HeaderCarrier,
         database: str | None = None,
         schema: str | None = None,
+        keep_alive: bool = False,
     ) -> SnowflakeConnection:
         """Create a Snowflake connection for the requesting user.
 
         On Connect: uses OAuth via Posit-Connect-User-Session-Token header.
         Locally: uses connection_name from ~/.snowflake/connections.toml.
+        With ``keep_alive`` the session is kept open past its idle timeout.
         """
         kwargs: dict = {"warehouse": self.warehouse}
+        if keep_alive:
+            kwargs["client_session_keep_alive"] = True
         if database:
             kwargs["database"] = database
         if schema:
@@ -113,18 +436,10 @@ class SnowflakeDiscovery:
 
         if session_token:
             # Connect mode: OAuth token exchange
-            if PositAuthenticator is None:
-                raise ImportError(
-                    "posit-sdk is required for Connect OAuth. "
-                    "Install with: pip install ggsql-rest[snowflake]"
-                )
-            auth = PositAuthenticator(
-                local_authenticator="EXTERNALBROWSER",
-                user_session_token=session_token,
-            )
+            authenticator, token = self._get_oauth_credentials(session_token)
             kwargs["account"] = self.account
-            kwargs["authenticator"] = auth.authenticator
-            kwargs["token"] = auth.token
+            kwargs["authenticator"] = authenticator
+            kwargs["token"] = token
         elif self.connection_name:
             # Local mode: connections.toml
             kwargs["connection_name"] = self.connection_name
@@ -137,52 +452,296 @@ class SnowflakeDiscovery:
 
         return snowflake_connector.connect(**kwargs)
 
-    def _discover_catalog(
+    def _get_pooled_connection(
+        self, user_id: str, request: _HeaderCarrier
+    ) -> SnowflakeConnection:
+        """Return the user's pooled discovery connection, reconnecting if closed.
+
+        Pooled connections are never closed by their callers; on a failed
+        query they should be dropped with ``_discard_connection``.
+        """
+        with self._connections_lock:
+            conn = self._connections.get(user_id)
+        if conn is not None and not conn.is_closed():
+            return conn
+
+        # Connect outside the lock so one slow login doesn't block other users
+        new_conn = self._create_connection(request, keep_alive=True)
+        with self._connections_lock:
+            current = self._connections.get(user_id)
+            if (
+                current is not None
+                and current is not conn
+                and not current.is_closed()
+            ):
+                # Another thread reconnected first; use its connection
+                new_conn.close()
+                return current
+            self._connections[user_id] = new_conn
+        return new_conn
+
+    def _discard_connection(self, user_id: str, conn: SnowflakeConnection) -> None:
+        """Drop a broken pooled connection so the next call reconnects."""
+        with self._connections_lock:
+            if self._connections.get(user_id) is conn:
+                del self._connections[user_id]
+        try:
+            conn.close()
+        except Exception:
+            pass  # The session is unusable either way
+
+    def _get_oauth_credentials(
+        self, session_token: str
+    ) -> tuple[str | None, str | None]:
+        """Return (authenticator, token) for a Connect user session token.
+
+        Minting a Snowflake token is an OAuth round-trip to Connect, so the
+        result is reused per session token until shortly before it expires.
+        If re-minting fails, the old token is returned and Snowflake decides
+        whether it is still valid.
+        """
+        now = time.monotonic()
+        cached = self._oauth_credentials.get(session_token)
+        if cached is not None and cached[0] > now:
+            return cached[1], cached[2]
+
+        if PositAuthenticator is None:
+            raise ImportError(
+                "posit-sdk is required for Connect OAuth. "
+                "Install with: pip install ggsql-rest[snowflake]"
+            )
+        try:
+            auth = PositAuthenticator(
+                local_authenticator="EXTERNALBROWSER",
+                user_session_token=session_token,
+            )
+            authenticator, token = auth.authenticator, auth.token
+        except Exception:
+            if cached is None:
+                raise
+            return cached[1], cached[2]
+
+        # Drop entries whose tokens have expired outright. Discovery threads
+        # may prune concurrently, so an entry can already be gone.
+        cutoff = now - (_OAUTH_TOKEN_LIFETIME - _OAUTH_TOKEN_TTL)
+        for key, (expires_at, _, _) in list(self._oauth_credentials.items()):
+            if expires_at < cutoff:
+                self._oauth_credentials.pop(key, None)
+
+        self._oauth_credentials[session_token] = (
+            now + _OAUTH_TOKEN_TTL,
+            authenticator,
+            token,
+        )
+        return authenticator, token
+
+    def _list_databases(self, cursor: SnowflakeCursor) -> list[str]:
+        """Return configured databases, or all visible ones via SHOW DATABASES.
+
+        With ``schemas`` set, returns the databases those schemas belong to
+        (restricted to ``databases``, if also set).
+        """
+        if self._schemas_by_database:
+            return [
+                db_name
+                for db_name in self._schemas_by_database
+                if not self.databases or db_name in self.databases
+            ]
+        if self.databases:
+            return list(self.databases)
+        return [row[1] for row in _show_paginated(cursor, "SHOW DATABASES")]
+
+    def _map_databases(
+        self,
+        fn: Callable[[str], _T],
+        db_names: list[str],
+    ) -> Iterator[_T]:
+        """Apply ``fn`` to each database concurrently, yielding results in order.
+
+        Each call is a few SHOW round-trips, so the work is latency-bound;
+        running databases side by side cuts wall time to roughly the slowest one.
+        """
+        if not db_names:
+            return
+        workers = min(_MAX_DISCOVERY_WORKERS, len(db_names))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            yield from executor.map(fn, db_names)
+
+    def _discover_database(
         self,
         conn: SnowflakeConnection,
+        db_name: str,
     ) -> list[tuple[str, str, str, str]]:
-        """Discover all accessible databases, schemas, and tables.
+        """Discover schemas and tables in a single database.
+
+        Uses one cursor for all of its queries, its own so databases can be
+        discovered concurrently.
+        Queries INFORMATION_SCHEMA.TABLES, falling back to SHOW TABLES if
+        that fails (e.g. no warehouse). With ``schemas`` configured, only
+        those schemas are listed, one SHOW TERSE TABLES each. Returns an
+        empty list if the database is inaccessible.
+        """
+        with conn.cursor() as cursor:
+            if self._schemas_by_database:
+                return self._show_schema_tables(
+                    cursor, db_name, self._schemas_by_database.get(db_name, [])
+                )
+            try:
+                cursor.execute(_TABLES_QUERY.format(_quote_identifier(db_name)))
+                return [
+                    (f"{db_name}.{schema_name}", db_name, schema_name, table_name)
+                    for schema_name, table_name in _iter_rows(cursor)
+                ]
+            except Exception:
+                return self._show_database_tables(cursor, db_name)
 
-        Returns list of (connection_name, database, schema, table_name) tuples.
-        Skips INFORMATION_SCHEMA and databases that error on access.
+    def _show_database_tables(
+        self,
+        cursor: SnowflakeCursor,
+        db_name: str,
+    ) -> list[tuple[str, str, str, str]]:
+        """Discover a database's tables with a single SHOW TERSE TABLES.
+
+        TERSE rows are (created_on, name, kind, database_name, schema_name),
+        so no per-schema queries are needed. If the database-wide SHOW fails
+        or fills a whole result (and so may be truncated), falls back to one
+        query per schema. Skips tables in _SKIP_SCHEMAS.
         """
-        results: list[tuple[str, str, str, str]] = []
-        cursor = conn.cursor()
+        query = _SHOW_TABLES.format(_quote_identifier(db_name))
+        try:
+            rows = _show_complete(cursor, query)
+        except Exception:
+            rows = None
+        if rows is None:
+            return self._show_schema_tables(cursor, db_name)
+        return [
+            (f"{db_name}.{row[4]}", db_name, row[4], row[1])
+            for row in rows
+            if row[4] not in _SKIP_SCHEMAS
+        ]
+
+    def _show_schema_tables(
+        self,
+        cursor: SnowflakeCursor,
+        db_name: str,
+        schema_names: list[str] | None = None,
+    ) -> list[tuple[str, str, str, str]]:
+        """Discover a database's tables with one SHOW TERSE TABLES per schema.
 
-        if self.databases:
-            # Use specified databases (skip SHOW DATABASES)
-            db_names = self.databases
-        else:
-            cursor.execute("SHOW DATABASES")
-            db_names = [row[1] for row in cursor.fetchall()]
+        Lists ``schema_names``, or every schema via SHOW TERSE SCHEMAS if None.
+        The per-schema queries are submitted together with execute_async and
+        their results collected afterwards by query id.
+        Skips _SKIP_SCHEMAS and schemas that error on access; returns an empty
+        list if the database is inaccessible.
+        """
+        quoted_db = _quote_identifier(db_name)
+        entries: list[tuple[str, str, str, str]] = []
 
-        for db_name in db_names:
+        if schema_names is None:
+            try:
+                schema_names = [
+                    row[1]
+                    for row in _show_paginated(cursor, _SHOW_SCHEMAS.format(quoted_db))
+                ]
+            except Exception:
+                return entries  # Skip inaccessible databases
 
+        # Submit every schema's first page without waiting, so Snowflake runs
+        # them side by side on this one connection, then collect in order
+        submitted: list[tuple[str, str, str]] = []
+        for schema_name in schema_names:
+            if schema_name in _SKIP_SCHEMAS:
+                continue
+            query = _SHOW_SCHEMA_TABLES.format(quoted_db, _quote_identifier(schema_name))
             try:
-                cursor.execute(f'SHOW SCHEMAS IN DATABASE "{db_name}"')
-                schemas = cursor.fetchall()
+                cursor.execute_async(f"{query} LIMIT {_SHOW_PAGE}")
             except Exception:
-                continue  # Skip inaccessible databases
+                continue  # Skip schemas whose query can't be submitted
+            if cursor.sfqid is not None:
+                submitted.append((schema_name, query, cursor.sfqid))
 
-            for schema_row in schemas:
-                schema_name = schema_row[1]
+        for schema_name, query, query_id in submitted:
+            conn_name = f"{db_name}.{schema_name}"
+            try:
+                # Waits for the query and raises if it failed
+                cursor.get_results_from_sfqid(query_id)
+                # A full first page is followed by the rest, synchronously
+                first_page = list(_iter_rows(cursor))
+                names = [
+                    row[1]
+                    for row in _show_paginated(cursor, query, first_page=first_page)
+                ]
+            except Exception:
+                continue  # Skip inaccessible schemas
+            entries.extend((conn_name, db_name, schema_name, name) for name in names)
 
-                if schema_name == "INFORMATION_SCHEMA":
-                    continue
+        return entries
 
-                conn_name = f"{db_name}.{schema_name}"
+    def _discover_account_catalog(
+        self,
+        cursor: SnowflakeCursor,
+    ) -> list[tuple[str, str, str, str]] | None:
+        """Discover every table in the account with one SHOW TERSE OBJECTS.
+
+        TERSE rows are (created_on, name, kind, database_name, schema_name).
+        Only used without ``databases``/``schemas`` filters, which are cheaper
+        to honour per database. Returns None when not applicable, or if the
+        query fails or may be truncated, so callers fall back to per-database
+        discovery. Entries are sorted by database, schema, and table.
+        """
+        if self.databases or self._schemas_by_database:
+            return None
+        try:
+            rows = _show_complete(cursor, _SHOW_ACCOUNT_OBJECTS)
+        except Exception:
+            return None
+        if rows is None:
+            return None
+        entries = [
+            (f"{row[3]}.{row[4]}", row[3], row[4], row[1])
+            for row in rows
+            if row[2] in _TABLE_KINDS and row[4] not in _SKIP_SCHEMAS
+        ]
+        entries.sort(key=itemgetter(1, 2, 3))
+        return entries
+
+    def _plan_discovery(
+        self,
+        conn: SnowflakeConnection,
+    ) -> tuple[list[tuple[str, str, str, str]] | None, list[str]]:
+        """Run catalog discovery's up-front SHOWs on one shared cursor.
 
-                try:
-                    cursor.execute(f'SHOW TABLES IN SCHEMA "{db_name}"."{schema_name}"')
-                    tables = cursor.fetchall()
-                except Exception:
-                    continue  # Skip inaccessible schemas
+        Returns (account_catalog, []) if the account-wide SHOW succeeded,
+        otherwise (None, database_names) for per-database discovery.
+        """
+        with conn.cursor() as cursor:
+            account_catalog = self._discover_account_catalog(cursor)
+            if account_catalog is not None:
+                return account_catalog, []
+            return None, self._list_databases(cursor)
 
-                for table_row in tables:
-                    table_name = table_row[1]
-                    results.append((conn_name, db_name, schema_name, table_name))
+    def _discover_catalog(
+        self,
+        conn: SnowflakeConnection,
+    ) -> list[tuple[str, str, str, str]]:
+        """Discover all accessible databases, schemas, and tables.
 
-        return results
+        Returns list of (connection_name, database, schema, table_name) tuples,
+        in database order. Tries a single account-wide SHOW first; otherwise
+        databases are discovered concurrently.
+        Skips INFORMATION_SCHEMA and databases that error on access.
+        """
+        account_catalog, db_names = self._plan_discovery(conn)
+        if account_catalog is not None:
+            return account_catalog
+
+        return [
+            entry
+            for entries in self._map_databases(
+                lambda db_name: self._discover_database(conn, db_name), db_names
+            )
+            for entry in entries
+        ]
 
     def _discover_catalog_by_database(
         self,
@@ -192,52 +751,94 @@ class SnowflakeDiscovery:
 
         Yields (database_name, entries) tuples where entries are
         (connection_name, database, schema, table_name) tuples.
+        A single account-wide SHOW is tried first; otherwise databases are
+        discovered concurrently and yielded as each finishes, so one slow
+        database does not hold back the rest.
         """
-        cursor = conn.cursor()
+        account_catalog, db_names = self._plan_discovery(conn)
+        if account_catalog is not None:
+            for db_name, entries in groupby(account_catalog, key=itemgetter(1)):
+                yield db_name, list(entries)
+            return
 
-        if self.databases:
-            db_names = self.databases
-        else:
-            cursor.execute("SHOW DATABASES")
-            db_names = [row[1] for row in cursor.fetchall()]
+        if not db_names:
+            return
+
+        workers = min(_MAX_DISCOVERY_WORKERS, len(db_names))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self._discover_database, conn, db_name): db_name
+                for db_name in db_names
+            }
+            try:
+                for future in as_completed(futures):
+                    entries = future.result()
+                    if entries:
+                        yield futures[future], entries
+            finally:
+                # Stop queued databases if the consumer goes away early
+                for future in futures:
+                    future.cancel()
+
+    def _discover_database_columns(
+        self,
+        conn: SnowflakeConnection,
+        db_name: str,
+    ) -> dict[tuple[str, str, str], list[tuple[str, str]]]:
+        """Fetch every column in one database with a single SHOW COLUMNS.
 
-        for db_name in db_names:
-            db_entries: list[tuple[str, str, str, str]] = []
+        Uses its own cursor so databases can be scanned concurrently.
+        Returns an empty dict if the database is inaccessible.
+        """
+        columns: defaultdict[tuple[str, str, str], list[tuple[str, str]]] = (
+            defaultdict(list)
+        )
 
+        with conn.cursor() as cursor:
             try:
-                cursor.execute(f'SHOW SCHEMAS IN DATABASE "{db_name}"')
-                schemas = cursor.fetchall()
+                cursor.execute(_SHOW_DATABASE_COLUMNS.format(_quote_identifier(db_name)))
+                _add_column_rows(columns, _iter_rows(cursor), {db_name})
             except Exception:
-                continue
+                return {}
 
-            for schema_row in schemas:
-                schema_name = schema_row[1]
-                if schema_name == "INFORMATION_SCHEMA":
-                    continue
+        return columns
 
-                conn_name = f"{db_name}.{schema_name}"
+    def _discover_account_columns(
+        self,
+        conn: SnowflakeConnection,
+        databases: list[str],
+    ) -> dict[tuple[str, str, str], list[tuple[str, str]]] | None:
+        """Fetch columns for ``databases`` with one SHOW COLUMNS IN ACCOUNT.
 
-                try:
-                    cursor.execute(
-                        f'SHOW TABLES IN SCHEMA "{db_name}"."{schema_name}"'
-                    )
-                    tables = cursor.fetchall()
-                except Exception:
-                    continue
+        Returns None if the query fails, or if it returns _SHOW_MAX_ROWS rows
+        and may therefore have been truncated.
+        """
+        columns: defaultdict[tuple[str, str, str], list[tuple[str, str]]] = (
+            defaultdict(list)
+        )
 
-                for table_row in tables:
-                    table_name = table_row[1]
-                    db_entries.append((conn_name, db_name, schema_name, table_name))
+        with conn.cursor() as cursor:
+            try:
+                cursor.execute(_SHOW_ACCOUNT_COLUMNS)
+                count = _add_column_rows(columns, _iter_rows(cursor), set(databases))
+            except Exception:
+                return None
 
-            if db_entries:
-                yield db_name, db_entries
+        if count >= _SHOW_MAX_ROWS:
+            return None  # Possibly truncated; scan database by database
+        return columns
 
     def _discover_columns(
         self,
         conn: SnowflakeConnection,
         databases: list[str],
     ) -> dict[tuple[str, str, str], list[tuple[str, str]]]:
-        """Discover columns for all tables using SHOW COLUMNS IN DATABASE.
+        """Discover columns for all tables via SHOW COLUMNS.
+
+        Without ``databases``/``schemas`` filters and with several databases,
+        tries a single SHOW COLUMNS IN ACCOUNT first; otherwise (or if that
+        fails or may be truncated) issues one SHOW COLUMNS IN DATABASE per
+        database, with databases scanned concurrently.
 
         Args:
             conn: Active Snowflake connection.
@@ -246,52 +847,48 @@ class SnowflakeDiscovery:
         Returns:
             Dict mapping (database, schema, table) -> [(column_name, data_type), ...]
         """
-        columns: dict[tuple[str, str, str], list[tuple[str, str]]] = {}
-        cursor = conn.cursor()
-
-        for db_name in databases:
-            try:
-                cursor.execute(f'SHOW COLUMNS IN DATABASE "{db_name}"')
-                rows = cursor.fetchall()
-            except Exception:
-                continue
-
-            for row in rows:
-                table_name = row[0]
-                schema_name = row[1]
-                col_name = row[2]
-                data_type_json = row[3]
-
-                if schema_name == "INFORMATION_SCHEMA":
-                    continue
-
-                key = (db_name, schema_name, table_name)
-                if key not in columns:
-                    columns[key] = []
-                columns[key].append((col_name, _parse_snowflake_type(data_type_json)))
+        whole_account = not self.databases and not self._schemas_by_database
+        if whole_account and len(databases) > 1:
+            account_columns = self._discover_account_columns(conn, databases)
+            if account_columns is not None:
+                return account_columns
 
+        columns: dict[tuple[str, str, str], list[tuple[str, str]]] = {}
+        for db_columns in self._map_databases(
+            lambda db_name: self._discover_database_columns(conn, db_name), databases
+        ):
+            columns.update(db_columns)
         return columns
 
-    def _extract_user_id(self, request: Request) -> str:
+    def _extract_user_id(self, request: _HeaderCarrier) -> str:
         """Extract user ID from request headers."""
         return request.headers.get("x-user-id", "anonymous")
 
     def _create_engine(
         self,
-        request: Request,
+        request: _HeaderCarrier,
         database: str,
         schema: str,
     ) -> Engine:
-        """Create a SQLAlchemy engine using snowflake.connector for auth."""
+        """Create a SQLAlchemy engine using snowflake.connector for auth.
+
+        Pooled connections are pinged before reuse and recycled before
+        Snowflake's idle session timeout can drop them.
+        """
         def creator():
             return self._create_connection(request, database=database, schema=schema)
-        return create_engine("snowflake://not@used/db", creator=creator)
+        return create_engine(
+            "snowflake://not@used/db",
+            creator=creator,
+            pool_pre_ping=True,
+            pool_recycle=3300,
+        )
 
     def _get_cached_engine(
         self,
         user_id: str,
         connection_name: str,
-        request: Request,
+        request: _HeaderCarrier,
         database: str,
         schema: str,
     ) -> Engine:
@@ -315,9 +912,94 @@ class SnowflakeDiscovery:
 
         return engine
 
+    def _disk_catalog_path(self, user_id: str) -> Path | None:
+        """Path of a user's on-disk catalog, or None if disk caching is off."""
+        if self.cache_dir is None:
+            return None
+        key = orjson.dumps(
+            [self.account, self.warehouse, user_id, self.databases, self.schemas]
+        )
+        digest = hashlib.sha256(key).hexdigest()[:16]
+        return self.cache_dir / f"catalog-{digest}.json"
+
+    def _read_disk_catalog(self, user_id: str) -> list[tuple[str, str, str, str]] | None:
+        """Load a user's catalog from ``cache_dir`` if present and fresh.
+
+        Files that don't hold a list of four-string entries (e.g. written by
+        another version) are ignored like missing ones.
+        """
+        path = self._disk_catalog_path(user_id)
+        if path is None:
+            return None
+        try:
+            if time.time() - path.stat().st_mtime >= _DISK_CATALOG_TTL:
+                return None
+            data = orjson.loads(path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return None  # Missing or unreadable; rediscover
+
+        if not isinstance(data, list):
+            return None
+        catalog_data: list[tuple[str, str, str, str]] = []
+        for entry in data:
+            if not (
+                isinstance(entry, list)
+                and len(entry) == 4
+                and all(isinstance(field, str) for field in entry)
+            ):
+                return None  # Unexpected shape; rediscover
+            catalog_data.append((entry[0], entry[1], entry[2], entry[3]))
+        return catalog_data
+
+    def _write_disk_catalog(
+        self, user_id: str, catalog_data: list[tuple[str, str, str, str]]
+    ) -> None:
+        """Persist a user's catalog to ``cache_dir``, if configured."""
+        path = self._disk_catalog_path(user_id)
+        if path is None:
+            return
+        # Write to a temporary file first so readers never see a partial file
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        tmp_path = path.with_name(path.name + suffix)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(orjson.dumps(catalog_data))
+            os.replace(tmp_path, path)
+        except OSError:
+            pass  # Best effort; the in-memory cache still works
+
+    def _cache_catalog(
+        self, user_id: str, catalog_data: list[tuple[str, str, str, str]]
+    ) -> dict[str, _ConnInfo]:
+        """Cache a user's catalog and the connections derived from it.
+
+        Returns the connections.
+        """
+        self._discovered_catalog[user_id] = catalog_data
+
+        connections: dict[str, _ConnInfo] = {}
+        for conn_name, database, schema, _table_name in catalog_data:
+            if conn_name not in connections:
+                connections[conn_name] = _ConnInfo(database, schema)
+        self._discovered_connections[user_id] = connections
+        return connections
+
+    def _user_connections(self, user_id: str) -> dict[str, _ConnInfo] | None:
+        """Return a user's discovered connections, or None if undiscovered.
+
+        The per-user caches evict independently, so connections evicted
+        while the user's catalog is still cached are rebuilt from it.
+        """
+        connections = self._discovered_connections.get(user_id)
+        if connections is None:
+            catalog_data = self._discovered_catalog.get(user_id)
+            if catalog_data is not None:
+                connections = self._cache_catalog(user_id, catalog_data)
+        return connections
+
     def get_table_names(
         self,
-        request: Request,
+        request: _HeaderCarrier,
     ) -> list[tuple[str, str]]:
         """Get table names and connection names for all accessible tables.
 
@@ -330,36 +1012,32 @@ class SnowflakeDiscovery:
         user_id = self._extract_user_id(request)
 
         # Return cached catalog if already discovered for this user
-        if user_id in self._discovered_catalog:
-            catalog_data = self._discovered_catalog[user_id]
+        catalog_data = self._discovered_catalog.get(user_id)
+        if catalog_data is not None:
+            self._user_connections(user_id)  # Keep its connections queryable
         else:
-            # Open a connection and discover catalog
-            conn = self._create_connection(request)
-            try:
-                catalog_data = self._discover_catalog(conn)
-            finally:
-                conn.close()
-
-            # Cache the catalog data
-            self._discovered_catalog[user_id] = catalog_data
-
-            # Also populate connections cache from catalog data
-            connections: dict[str, tuple[str, str]] = {}
-            for conn_name, database, schema, _table_name in catalog_data:
-                if conn_name not in connections:
-                    connections[conn_name] = (database, schema)
-            self._discovered_connections[user_id] = connections
+            catalog_data = self._read_disk_catalog(user_id)
+            if catalog_data is None:
+                # Discover the catalog on the user's pooled connection
+                conn = self._get_pooled_connection(user_id, request)
+                try:
+                    catalog_data = self._discover_catalog(conn)
+                except Exception:
+                    self._discard_connection(user_id, conn)
+                    raise
+                self._write_disk_catalog(user_id, catalog_data)
 
-        # Build result list of (table_name, connection_name) tuples
-        result: list[tuple[str, str]] = []
-        for conn_name, _database, _schema, table_name in catalog_data:
-            result.append((table_name, conn_name))
+            # Cache the catalog and the connections derived from it
+            self._cache_catalog(user_id, catalog_data)
 
-        return result
+        return [
+            (table_name, conn_name)
+            for conn_name, _database, _schema, table_name in catalog_data
+        ]
 
     def stream_table_names(
         self,
-        request: Request,
+        request: _HeaderCarrier,
     ) -> Iterator[tuple[str, list[tuple[str, str]]]]:
         """Stream table names per-database.
 
@@ -370,27 +1048,33 @@ class SnowflakeDiscovery:
         """
         user_id = self._extract_user_id(request)
 
-        # If already cached, yield everything at once (grouped by database)
-        if user_id in self._discovered_catalog:
-            catalog_data = self._discovered_catalog[user_id]
-            by_db: dict[str, list[tuple[str, str]]] = {}
-            for conn_name, database, _schema, table_name in catalog_data:
-                by_db.setdefault(database, []).append((table_name, conn_name))
-            for db_name, entries in by_db.items():
-                yield db_name, entries
+        catalog_data = self._discovered_catalog.get(user_id)
+        if catalog_data is not None:
+            self._user_connections(user_id)  # Keep its connections queryable
+        else:
+            catalog_data = self._read_disk_catalog(user_id)
+            if catalog_data is not None:
+                self._cache_catalog(user_id, catalog_data)
+
+        # If already cached, yield everything at once, one batch per database.
+        # Each database's entries are contiguous in the catalog, since they
+        # are always discovered and stored together.
+        if catalog_data is not None:
+            for db_name, rows in groupby(catalog_data, key=itemgetter(1)):
+                yield db_name, [(row[3], row[0]) for row in rows]
             return
 
-        conn = self._create_connection(request)
+        conn = self._get_pooled_connection(user_id, request)
         try:
             all_catalog: list[tuple[str, str, str, str]] = []
-            connections: dict[str, tuple[str, str]] = {}
+            connections: dict[str, _ConnInfo] = {}
 
             for db_name, db_entries in self._discover_catalog_by_database(conn):
                 batch: list[tuple[str, str]] = []
                 for conn_name, database, schema, table_name in db_entries:
                     all_catalog.append((conn_name, database, schema, table_name))
                     if conn_name not in connections:
-                        connections[conn_name] = (database, schema)
+                        connections[conn_name] = _ConnInfo(database, schema)
                     batch.append((table_name, conn_name))
 
                 # Register connections before yielding so they're queryable
@@ -401,64 +1085,104 @@ class SnowflakeDiscovery:
 
             # Cache full catalog after iteration completes
             self._discovered_catalog[user_id] = all_catalog
-        finally:
-            conn.close()
+            self._write_disk_catalog(user_id, all_catalog)
+        except Exception:
+            self._discard_connection(user_id, conn)
+            raise
 
     def get_tables(
         self,
-        request: Request,
+        request: _HeaderCarrier,
         include_stats: bool,
-    ) -> list[TableSchema]:
+    ) -> Mapping[str, TableSchema]:
         """Get table schemas for all connections the user has access to.
 
         Uses SHOW COLUMNS IN DATABASE to get column metadata from the
         existing discovery connection, avoiding per-schema engine creation.
+        Cached per user; once older than ``cache_ttl`` the cached schemas are
+        returned immediately and refreshed in a background thread.
+
+        Returns:
+            Read-only mapping of "DATABASE.SCHEMA.TABLE" (the connection name
+            and table name) -> TableSchema.
         """
         user_id = self._extract_user_id(request)
 
-        # Return cached tables if already discovered for this user
-        if user_id in self._discovered_tables:
-            return self._discovered_tables[user_id]
+        cached = self._discovered_tables.get_with_age(user_id)
+        if cached is None:
+            return self._load_tables(user_id, request)
+
+        tables, age = cached
+        if age >= self.cache_ttl:
+            self._schedule_refresh(user_id, request)
+        return tables
+
+    def _schedule_refresh(self, user_id: str, request: _HeaderCarrier) -> None:
+        """Start a background refresh of a user's tables, unless one is running."""
+        with self._refresh_lock:
+            if user_id in self._refreshing:
+                return
+            self._refreshing.add(user_id)
+        threading.Thread(
+            target=self._refresh_tables, args=(user_id, request), daemon=True
+        ).start()
+
+    def _refresh_tables(self, user_id: str, request: _HeaderCarrier) -> None:
+        """Reload a user's tables; on failure the stale entry is kept."""
+        try:
+            self._load_tables(user_id, request)
+        except Exception:
+            pass  # Keep serving the stale schemas; the next call retries
+        finally:
+            with self._refresh_lock:
+                self._refreshing.discard(user_id)
+
+    def _load_tables(
+        self, user_id: str, request: _HeaderCarrier
+    ) -> dict[str, TableSchema]:
+        """Discover a user's tables and columns, and cache the result.
 
-        # Open a single connection for all discovery
-        conn = self._create_connection(request)
+        Returns the tables keyed by "DATABASE.SCHEMA.TABLE".
+        """
+        # Use the user's pooled connection for all discovery
+        conn = self._get_pooled_connection(user_id, request)
         try:
             catalog_data = self._discover_catalog(conn)
 
             # Build connections dict and collect metadata
-            connections: dict[str, tuple[str, str]] = {}
+            connections: dict[str, _ConnInfo] = {}
             databases: set[str] = set()
             table_connections: dict[tuple[str, str, str], str] = {}
 
             for conn_name, database, schema, table_name in catalog_data:
                 if conn_name not in connections:
-                    connections[conn_name] = (database, schema)
+                    connections[conn_name] = _ConnInfo(database, schema)
                 databases.add(database)
                 table_connections[(database, schema, table_name)] = conn_name
 
             # Get all columns via SHOW COLUMNS IN DATABASE
             all_columns = self._discover_columns(conn, sorted(databases))
-        finally:
-            conn.close()
+        except Exception:
+            self._discard_connection(user_id, conn)
+            raise
 
-        # Build TableSchema objects
+        # Build TableSchema objects. Names and types come straight from
+        # Snowflake as plain strings, so pydantic validation is skipped.
         from ._models import ColumnSchema, TableSchema
 
-        all_tables: list[TableSchema] = []
+        all_tables: dict[str, TableSchema] = {}
         for (db, schema, table), cols in all_columns.items():
             conn_name = table_connections.get((db, schema, table))
             if conn_name is None:
                 continue  # Column for a table not in our catalog (e.g., views)
 
-            all_tables.append(
-                TableSchema(
-                    table_name=table,
-                    connection=conn_name,
-                    columns=[
-                        ColumnSchema(column_name=name, data_type=dtype)
-                        for name, dtype in cols
-                    ],
-                )
+            all_tables[f"{conn_name}.{table}"] = TableSchema.model_construct(
+                table_name=table,
+                connection=conn_name,
+                columns=[
+                    ColumnSchema.model_construct(column_name=name, data_type=dtype)
+                    for name, dtype in cols
+                ],
             )
 
         # Cache results
@@ -470,7 +1194,7 @@ class SnowflakeDiscovery:
     def get_engine(
         self,
         connection_name: str,
-        request: Request,
+        request: _HeaderCarrier,
     ) -> Engine:
         """Get engine for a specific connection.
 
@@ -482,39 +1206,37 @@ class SnowflakeDiscovery:
         user_id = self._extract_user_id(request)
 
         # Look up connection in user's discovered connections
-        if user_id not in self._discovered_connections:
+        connections = self._user_connections(user_id)
+        if connections is None or connection_name not in connections:
             raise KeyError(f"Connection '{connection_name}' not found")
 
-        connections = self._discovered_connections[user_id]
-        if connection_name not in connections:
-            raise KeyError(f"Connection '{connection_name}' not found")
-
-        database, schema = connections[connection_name]
-        return self._get_cached_engine(user_id, connection_name, request, database, schema)
+        info = connections[connection_name]
+        return self._get_cached_engine(
+            user_id, connection_name, request, info.database, info.schema
+        )
 
     def has_connection(
         self,
         connection_name: str,
-        request: Request,
+        request: _HeaderCarrier,
     ) -> bool:
         """Check if a connection belongs to this discovery."""
-        user_id = self._extract_user_id(request)
-        if user_id not in self._discovered_connections:
-            return False
-        return connection_name in self._discovered_connections[user_id]
+        connections = self._user_connections(self._extract_user_id(request))
+        return connections is not None and connection_name in connections
 
     def get_single_table_schema(
         self,
-        request: Request,
+        request: _HeaderCarrier,
         table_name: str,
         connection: str,
     ) -> TableSchema | None:
         """Get column schema for a single Snowflake table.
 
-        Uses SHOW COLUMNS IN TABLE for targeted introspection.
+        Served from the user's cached get_tables() result when it has the
+        table; otherwise uses SHOW COLUMNS IN TABLE for targeted introspection.
 
         Args:
-            request: FastAPI request (for auth).
+            request: Incoming request (for auth).
             table_name: The table name.
             connection: Connection name in "DATABASE.SCHEMA" format.
 
@@ -524,32 +1246,39 @@ class SnowflakeDiscovery:
         from ._models import ColumnSchema, TableSchema
 
         user_id = self._extract_user_id(request)
-        connections = self._discovered_connections.get(user_id, {})
-        if connection not in connections:
+        connections = self._user_connections(user_id)
+        if connections is None or connection not in connections:
             return None
 
+        user_tables = self._discovered_tables.get(user_id, {})
+        cached = user_tables.get(f"{connection}.{table_name}")
+        if cached is not None:
+            return cached
+
         database, schema = connections[connection]
 
         conn = self._create_connection(request, database=database, schema=schema)
         try:
-            cursor = conn.cursor()
-            cursor.execute(
-                f'SHOW COLUMNS IN TABLE "{database}"."{schema}"."{table_name}"'
-            )
-            rows = cursor.fetchall()
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    _SHOW_TABLE_COLUMNS.format(
+                        _quote_identifier(database),
+                        _quote_identifier(schema),
+                        _quote_identifier(table_name),
+                    )
+                )
+                columns = [
+                    ColumnSchema.model_construct(
+                        column_name=row[2],
+                        data_type=_parse_snowflake_type(row[3]),
+                    )
+                    for row in _iter_rows(cursor)
+                ]
 
-            if not rows:
+            if not columns:
                 return None
 
-            columns = [
-                ColumnSchema(
-                    column_name=row[2],
-                    data_type=_parse_snowflake_type(row[3]),
-                )
-                for row in rows
-            ]
-
-            return TableSchema(
+            return TableSchema.model_construct(
                 table_name=table_name,
                 connection=connection,
                 columns=columns,
@@ -558,10 +1287,16 @@ class SnowflakeDiscovery:
             conn.close()
 
     def dispose_all(self) -> None:
-        """Dispose all cached engines and clear caches."""
+        """Dispose all cached engines, close pooled connections, and clear caches."""
         for engine in self._engines.values():
             engine.dispose()
         self._engines.clear()
+        with self._connections_lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+        for conn in connections:
+            conn.close()
         self._discovered_connections.clear()
         self._discovered_tables.clear()
         self._discovered_catalog.clear()
+        self._oauth_credentials.clear()
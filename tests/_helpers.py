@@ -0,0 +1,30 @@
+"""Payloads and assertion helpers shared by the route tests."""
+
+import io
+from typing import Any
+
+from httpx import Response
+
+CSV_XYLABEL = b"x,y,label\n1,10,a\n2,20,b\n3,30,a"
+CSV_SCORES = b"score,category\n10,A\n20,B\n30,A"
+
+
+def upload_files(data: bytes = CSV_XYLABEL, filename: str = "data.csv") -> dict:
+    """Multipart ``files`` payload for the upload route.
+
+    Builds a new BytesIO each call, since the upload consumes it.
+    """
+    return {"file": (filename, io.BytesIO(data), "text/csv")}
+
+
+def success_data(response: Response) -> Any:
+    """Assert a 200 success envelope and return its ``data`` payload."""
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["status"] == "success"
+    return body["data"]
+
+
+def tables_for(tables: list[dict], connection: str | None) -> list[dict]:
+    """Entries of a table listing that belong to ``connection`` (None = local)."""
+    return [t for t in tables if t["connection"] == connection]
@@ -1,18 +1,49 @@
 """Pytest configuration and fixtures."""
 
+from collections.abc import AsyncIterator, Iterator
+
+import polars as pl
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import Engine, create_engine, text
 
 from ggsql_rest import create_app, ConnectionRegistry
-from ggsql_rest._sessions import SessionManager
+from ggsql_rest._errors import register_error_handlers
+from ggsql_rest._routes._dependencies import get_registry
+from ggsql_rest._routes._query import router as query_router
+from ggsql_rest._routes._schema import router as schema_router
+from ggsql_rest._routes._sessions import router as sessions_router, get_session_manager
+from ggsql_rest._sessions import SessionManager, make_sample_data
 
 
-@pytest.fixture
-def registry() -> ConnectionRegistry:
-    """Create a fresh connection registry."""
+@pytest.fixture(scope="session")
+def anyio_backend() -> str:
+    """Run async tests on asyncio with one event loop for the whole session."""
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+def _shared_registry() -> ConnectionRegistry:
+    """Connection registry reused across tests; see ``registry``."""
     return ConnectionRegistry()
 
 
+@pytest.fixture
+def registry(_shared_registry: ConnectionRegistry) -> Iterator[ConnectionRegistry]:
+    """Empty connection registry, emptied again after the test.
+
+    Engines created during the test are disposed, so their pools don't
+    outlive it.
+    """
+    try:
+        yield _shared_registry
+    finally:
+        _shared_registry.dispose_all()
+        _shared_registry.clear()
+
+
 @pytest.fixture
 def session_manager() -> SessionManager:
     """Create a fresh session manager."""
@@ -29,3 +60,101 @@ def app(registry: ConnectionRegistry):
 def client(app) -> TestClient:
     """Create a test client."""
     return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def sample_seed() -> list[tuple[str, pl.DataFrame]]:
+    """The --load-sample-data tables, built once; tests must not mutate them."""
+    return make_sample_data()
+
+
+@pytest.fixture(scope="module")
+def users_engine(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Engine]:
+    """File-backed SQLite engine with a seeded ``users`` table.
+
+    Tests only read from it, so it is built once per module. The data lives
+    in a file, so the ``registry`` fixture disposing the engine between
+    tests only closes its pooled connections.
+    """
+    db_path = tmp_path_factory.mktemp("users") / "users.db"
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        connect_args={"check_same_thread": False},
+    )
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE users (id INTEGER, name TEXT)"))
+        conn.execute(text("INSERT INTO users VALUES (1, 'Alice'), (2, 'Bob')"))
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def routes_app() -> FastAPI:
+    """Bare app with the session, query, and schema routers (no /api/v1 prefix).
+
+    Built once per test session; per-test state is injected through
+    dependency overrides by the ``session_mgr`` fixture.
+    """
+    app = FastAPI()
+    app.include_router(sessions_router)
+    app.include_router(query_router)
+    app.include_router(schema_router)
+    register_error_handlers(app)
+    return app
+
+
+@pytest.fixture
+def session_mgr(
+    routes_app: FastAPI,
+    registry: ConnectionRegistry,
+) -> Iterator[SessionManager]:
+    """Fresh SessionManager wired into routes_app, along with ``registry``."""
+    session_mgr = SessionManager(timeout_mins=30)
+    routes_app.dependency_overrides[get_session_manager] = lambda: session_mgr
+    routes_app.dependency_overrides[get_registry] = lambda: registry
+    try:
+        yield session_mgr
+    finally:
+        routes_app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="session")
+def _routes_test_client(routes_app: FastAPI) -> Iterator[TestClient]:
+    """Long-lived TestClient for routes_app; lifespan runs once per session."""
+    with TestClient(routes_app) as client:
+        yield client
+
+
+@pytest.fixture
+def routes_client(
+    _routes_test_client: TestClient,
+    session_mgr: SessionManager,
+) -> TestClient:
+    """Shared TestClient for routes_app with this test's overrides installed."""
+    return _routes_test_client
+
+
+@pytest.fixture(scope="session")
+def routes_transport(routes_app: FastAPI) -> ASGITransport:
+    """In-process ASGI transport for routes_app, shared by all async clients."""
+    return ASGITransport(app=routes_app)
+
+
+@pytest.fixture(scope="session")
+async def _routes_async_client(
+    routes_transport: ASGITransport,
+) -> AsyncIterator[AsyncClient]:
+    """Long-lived async client for routes_app, opened once per session."""
+    async with AsyncClient(
+        transport=routes_transport, base_url="http://test"
+    ) as client:
+        yield client
+
+
+@pytest.fixture
+def async_client(
+    _routes_async_client: AsyncClient,
+    session_mgr: SessionManager,
+) -> AsyncClient:
+    """Shared async client for routes_app with this test's overrides installed."""
+    return _routes_async_client
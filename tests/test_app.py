@@ -1,10 +1,12 @@
 """Tests for app factory."""
 
+import orjson
 import pytest
 from fastapi.testclient import TestClient
 from httpx import AsyncClient, ASGITransport
 
 from ggsql_rest import create_app, ConnectionRegistry
+from ggsql_rest._responses import OrjsonResponse
 
 
 def test_create_app():
@@ -19,6 +21,21 @@ def test_create_app():
     assert response.json() == {"status": "ok"}
 
 
+def test_create_app_uses_orjson_responses():
+    registry = ConnectionRegistry()
+    app = create_app(registry)
+    assert app.router.default_response_class is OrjsonResponse
+
+    client = TestClient(app)
+    response = client.get("/api/v1/health")
+    assert orjson.loads(response.content) == {"status": "ok"}
+
+    # Error responses go through the same renderer
+    response = client.delete("/api/v1/sessions/nonexistent")
+    assert response.status_code == 404
+    assert orjson.loads(response.content)["error"]["type"] == "SessionNotFound"
+
+
 def test_create_app_with_cors():
     registry = ConnectionRegistry()
     app = create_app(registry, cors_origins=["http://localhost:3000"])
@@ -134,3 +134,16 @@ def test_register_with_multiple_providers():
     assert registry.get_provider("pg_conn") == "postgresql"
     assert registry.get_provider("mysql_conn") == "mysql"
     assert registry.get_provider("no_provider") is None
+
+
+def test_clear_forgets_connections_and_engines():
+    """clear() removes factories, providers, and cached engines."""
+    registry = ConnectionRegistry()
+    registry.register("db", lambda req: create_engine("sqlite:///:memory:"), provider="sqlite")
+    registry.get_engine("db", MagicMock(headers={}))
+
+    registry.clear()
+
+    assert registry.list_connections() == []
+    assert registry.get_provider("db") is None
+    assert len(registry._engines) == 0
@@ -1,477 +1,350 @@
 """Tests for schema route."""
 
-import io
 import json
 import pytest
-from fastapi import FastAPI
-from httpx import ASGITransport, AsyncClient
-from sqlalchemy import create_engine, text
-from sqlalchemy.pool import StaticPool
+from httpx import AsyncClient
+from sqlalchemy import Engine
 
 from ggsql_rest import ConnectionRegistry
-from ggsql_rest._errors import register_error_handlers
-from ggsql_rest._sessions import SessionManager
-from ggsql_rest._routes._sessions import router as sessions_router
-from ggsql_rest._routes._sessions import get_session_manager
-from ggsql_rest._routes._query import router as query_router
-from ggsql_rest._routes._schema import router as schema_router
-from ggsql_rest._routes._dependencies import get_registry
+from ggsql_rest._sessions import Session, SessionManager
 
+from ._helpers import CSV_SCORES, success_data, tables_for, upload_files
 
-def create_test_app(registry: ConnectionRegistry) -> tuple[FastAPI, SessionManager]:
-    """Create test app with schema, sessions, and query routers."""
-    app = FastAPI()
-    session_mgr = SessionManager(timeout_mins=30)
 
-    app.dependency_overrides[get_session_manager] = lambda: session_mgr
-    app.dependency_overrides[get_registry] = lambda: registry
-
-    app.include_router(sessions_router)
-    app.include_router(query_router)
-    app.include_router(schema_router)
-    register_error_handlers(app)
-
-    return app, session_mgr
+@pytest.fixture
+async def uploaded_session(
+    async_client: AsyncClient,
+    session_mgr: SessionManager,
+) -> Session:
+    """Session with ``data.csv`` uploaded as local table ``data``."""
+    session = session_mgr.create()
+    response = await async_client.post(
+        f"/sessions/{session.id}/upload", files=upload_files()
+    )
+    assert response.status_code == 200
+    return session
 
 
 @pytest.mark.anyio
-async def test_schema_local_table():
+async def test_schema_local_table(
+    async_client: AsyncClient,
+    uploaded_session: Session,
+):
     """Schema returns uploaded table columns."""
-    app, session_mgr = create_test_app(ConnectionRegistry())
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
-        session = session_mgr.create()
+    response = await async_client.get(f"/sessions/{uploaded_session.id}/schema")
 
-        csv_content = b"x,y,label\n1,10,a\n2,20,b\n3,30,a"
-        files = {"file": ("data.csv", io.BytesIO(csv_content), "text/csv")}
-        await client.post(f"/sessions/{session.id}/upload", files=files)
-
-        response = await client.get(f"/sessions/{session.id}/schema")
-
-        assert response.status_code == 200
-        body = response.json()
-        assert body["status"] == "success"
-        tables = body["data"]["tables"]
-        assert len(tables) == 1
-        assert tables[0]["tableName"] == "data"
-        assert tables[0]["connection"] is None
-        assert len(tables[0]["columns"]) == 3
+    tables = success_data(response)["tables"]
+    assert len(tables) == 1
+    assert tables[0]["tableName"] == "data"
+    assert tables[0]["connection"] is None
+    assert len(tables[0]["columns"]) == 3
 
 
 @pytest.mark.anyio
-async def test_schema_with_stats():
+async def test_schema_with_stats(
+    async_client: AsyncClient,
+    session_mgr: SessionManager,
+):
     """Schema with include_stats returns column statistics."""
-    app, session_mgr = create_test_app(ConnectionRegistry())
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
-        session = session_mgr.create()
+    session = session_mgr.create()
 
-        csv_content = b"score,category\n10,A\n20,B\n30,A"
-        files = {"file": ("data.csv", io.BytesIO(csv_content), "text/csv")}
-        await client.post(f"/sessions/{session.id}/upload", files=files)
+    await async_client.post(
+        f"/sessions/{session.id}/upload", files=upload_files(CSV_SCORES)
+    )
 
-        response = await client.get(
-            f"/sessions/{session.id}/schema?include_stats=true"
-        )
+    response = await async_client.get(
+        f"/sessions/{session.id}/schema?include_stats=true"
+    )
 
-        assert response.status_code == 200
-        tables = response.json()["data"]["tables"]
-        columns = {c["columnName"]: c for c in tables[0]["columns"]}
+    tables = success_data(response)["tables"]
+    columns = {c["columnName"]: c for c in tables[0]["columns"]}
 
-        # Numeric column should have min/max
-        assert columns["score"]["minValue"] is not None
-        assert columns["score"]["maxValue"] is not None
+    # Numeric column should have min/max
+    assert columns["score"]["minValue"] is not None
+    assert columns["score"]["maxValue"] is not None
 
 
 @pytest.mark.anyio
-async def test_schema_with_remote_connection():
-    """Schema includes tables from remote connections."""
-    engine = create_engine(
-        "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    with engine.begin() as conn:
-        conn.execute(text("CREATE TABLE users (id INTEGER, name TEXT)"))
-        conn.execute(text("INSERT INTO users VALUES (1, 'Alice'), (2, 'Bob')"))
-
-    registry = ConnectionRegistry()
-    registry.register("test_db", lambda _req: engine)
+@pytest.mark.parametrize(
+    "path, has_columns",
+    [("schema", True), ("schema/tables", False)],
+)
+async def test_schema_with_remote_connection(
+    async_client: AsyncClient,
+    session_mgr: SessionManager,
+    registry: ConnectionRegistry,
+    users_engine: Engine,
+    path: str,
+    has_columns: bool,
+):
+    """Full schema and table-name listings both include remote tables."""
+    registry.register("test_db", lambda _req: users_engine)
 
-    app, session_mgr = create_test_app(registry)
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
-        session = session_mgr.create()
+    session = session_mgr.create()
 
-        response = await client.get(f"/sessions/{session.id}/schema")
+    response = await async_client.get(f"/sessions/{session.id}/{path}")
 
-        assert response.status_code == 200
-        tables = response.json()["data"]["tables"]
+    tables = success_data(response)["tables"]
 
-        remote_tables = [t for t in tables if t["connection"] == "test_db"]
-        assert len(remote_tables) == 1
-        assert remote_tables[0]["tableName"] == "users"
+    remote_tables = tables_for(tables, "test_db")
+    assert len(remote_tables) == 1
+    assert remote_tables[0]["tableName"] == "users"
+    assert ("columns" in remote_tables[0]) == has_columns
 
 
 @pytest.mark.anyio
-async def test_schema_empty_session():
+async def test_schema_empty_session(
+    async_client: AsyncClient,
+    session_mgr: SessionManager,
+):
     """Schema with no tables returns empty list."""
-    app, session_mgr = create_test_app(ConnectionRegistry())
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
-        session = session_mgr.create()
+    session = session_mgr.create()
 
-        response = await client.get(f"/sessions/{session.id}/schema")
+    response = await async_client.get(f"/sessions/{session.id}/schema")
 
-        assert response.status_code == 200
-        assert response.json()["data"]["tables"] == []
+    assert success_data(response)["tables"] == []
 
 
 @pytest.mark.anyio
-async def test_schema_session_not_found():
+async def test_schema_session_not_found(async_client: AsyncClient):
     """Schema for nonexistent session returns 404."""
-    app, _ = create_test_app(ConnectionRegistry())
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
-        response = await client.get("/sessions/nonexistent/schema")
-        assert response.status_code == 404
+    response = await async_client.get("/sessions/nonexistent/schema")
+    assert response.status_code == 404
 
 
 @pytest.mark.anyio
-async def test_schema_tables_local():
+async def test_schema_tables_local(
+    async_client: AsyncClient,
+    uploaded_session: Session,
+):
     """Schema tables endpoint returns just table names without columns."""
-    app, session_mgr = create_test_app(ConnectionRegistry())
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
-        session = session_mgr.create()
-
-        # Upload a CSV to create a local table
-        csv_content = b"x,y,label\n1,10,a\n2,20,b\n3,30,a"
-        files = {"file": ("data.csv", io.BytesIO(csv_content), "text/csv")}
-        await client.post(f"/sessions/{session.id}/upload", files=files)
-
-        # Request table names
-        response = await client.get(f"/sessions/{session.id}/schema/tables")
-
-        assert response.status_code == 200
-        body = response.json()
-        assert body["status"] == "success"
-        tables = body["data"]["tables"]
-        assert len(tables) == 1
-        assert tables[0]["tableName"] == "data"
-        assert tables[0]["connection"] is None
-        # Verify no columns are included
-        assert "columns" not in tables[0]
+    # Request table names
+    response = await async_client.get(f"/sessions/{uploaded_session.id}/schema/tables")
 
-
-@pytest.mark.anyio
-async def test_schema_tables_with_remote():
-    """Schema tables endpoint includes remote connection tables."""
-    # Create a SQLite in-memory engine with a table
-    engine = create_engine(
-        "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    with engine.begin() as conn:
-        conn.execute(text("CREATE TABLE users (id INTEGER, name TEXT)"))
-        conn.execute(text("INSERT INTO users VALUES (1, 'Alice'), (2, 'Bob')"))
-
-    registry = ConnectionRegistry()
-    registry.register("test_db", lambda _req: engine)
-
-    app, session_mgr = create_test_app(registry)
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
-        session = session_mgr.create()
-
-        # Request table names
-        response = await client.get(f"/sessions/{session.id}/schema/tables")
-
-        assert response.status_code == 200
-        tables = response.json()["data"]["tables"]
-
-        # Find the remote table
-        remote_tables = [t for t in tables if t["connection"] == "test_db"]
-        assert len(remote_tables) == 1
-        assert remote_tables[0]["tableName"] == "users"
-        # Verify no columns are included
-        assert "columns" not in remote_tables[0]
+    tables = success_data(response)["tables"]
+    assert len(tables) == 1
+    assert tables[0]["tableName"] == "data"
+    assert tables[0]["connection"] is None
+    # Verify no columns are included
+    assert "columns" not in tables[0]
 
 
 @pytest.mark.anyio
-async def test_schema_table_local():
+async def test_schema_table_local(
+    async_client: AsyncClient,
+    uploaded_session: Session,
+):
     """Per-table schema endpoint returns local table columns."""
-    app, session_mgr = create_test_app(ConnectionRegistry())
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
-        session = session_mgr.create()
-
-        csv_content = b"x,y,label\n1,10,a\n2,20,b\n3,30,a"
-        files = {"file": ("data.csv", io.BytesIO(csv_content), "text/csv")}
-        await client.post(f"/sessions/{session.id}/upload", files=files)
-
-        response = await client.get(f"/sessions/{session.id}/schema/table/data")
+    response = await async_client.get(
+        f"/sessions/{uploaded_session.id}/schema/table/data"
+    )
 
-        assert response.status_code == 200
-        body = response.json()
-        assert body["status"] == "success"
-        table = body["data"]
-        assert table["tableName"] == "data"
-        assert table["connection"] is None
-        assert len(table["columns"]) == 3
-        column_names = {c["columnName"] for c in table["columns"]}
-        assert column_names == {"x", "y", "label"}
+    table = success_data(response)
+    assert table["tableName"] == "data"
+    assert table["connection"] is None
+    assert len(table["columns"]) == 3
+    column_names = {c["columnName"] for c in table["columns"]}
+    assert column_names == {"x", "y", "label"}
 
 
 @pytest.mark.anyio
-async def test_schema_table_with_stats():
+async def test_schema_table_with_stats(
+    async_client: AsyncClient,
+    session_mgr: SessionManager,
+):
     """Per-table schema endpoint with include_stats returns column statistics."""
-    app, session_mgr = create_test_app(ConnectionRegistry())
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
-        session = session_mgr.create()
+    session = session_mgr.create()
 
-        csv_content = b"score,category\n10,A\n20,B\n30,A"
-        files = {"file": ("data.csv", io.BytesIO(csv_content), "text/csv")}
-        await client.post(f"/sessions/{session.id}/upload", files=files)
+    await async_client.post(
+        f"/sessions/{session.id}/upload", files=upload_files(CSV_SCORES)
+    )
 
-        response = await client.get(
-            f"/sessions/{session.id}/schema/table/data?include_stats=true"
-        )
+    response = await async_client.get(
+        f"/sessions/{session.id}/schema/table/data?include_stats=true"
+    )
 
-        assert response.status_code == 200
-        table = response.json()["data"]
-        columns = {c["columnName"]: c for c in table["columns"]}
+    table = success_data(response)
+    columns = {c["columnName"]: c for c in table["columns"]}
 
-        # Numeric column should have min/max
-        assert columns["score"]["minValue"] == "10"
-        assert columns["score"]["maxValue"] == "30"
+    # Numeric column should have min/max
+    assert columns["score"]["minValue"] == "10"
+    assert columns["score"]["maxValue"] == "30"
 
-        # Categorical column should have values
-        assert "categoricalValues" in columns["category"]
-        assert set(columns["category"]["categoricalValues"]) == {"A", "B"}
+    # Categorical column should have values
+    assert "categoricalValues" in columns["category"]
+    assert set(columns["category"]["categoricalValues"]) == {"A", "B"}
 
 
 @pytest.mark.anyio
-async def test_schema_table_remote():
+async def test_schema_table_remote(
+    async_client: AsyncClient,
+    session_mgr: SessionManager,
+    registry: ConnectionRegistry,
+    users_engine: Engine,
+):
     """Per-table schema endpoint returns remote table columns."""
-    engine = create_engine(
-        "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    with engine.begin() as conn:
-        conn.execute(text("CREATE TABLE users (id INTEGER, name TEXT)"))
-        conn.execute(text("INSERT INTO users VALUES (1, 'Alice'), (2, 'Bob')"))
-
-    registry = ConnectionRegistry()
-    registry.register("test_db", lambda _req: engine)
+    registry.register("test_db", lambda _req: users_engine)
 
-    app, session_mgr = create_test_app(registry)
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
-        session = session_mgr.create()
+    session = session_mgr.create()
 
-        response = await client.get(
-            f"/sessions/{session.id}/schema/table/users?connection=test_db"
-        )
+    response = await async_client.get(
+        f"/sessions/{session.id}/schema/table/users?connection=test_db"
+    )
 
-        assert response.status_code == 200
-        table = response.json()["data"]
-        assert table["tableName"] == "users"
-        assert table["connection"] == "test_db"
-        column_names = {c["columnName"] for c in table["columns"]}
-        assert column_names == {"id", "name"}
+    table = success_data(response)
+    assert table["tableName"] == "users"
+    assert table["connection"] == "test_db"
+    column_names = {c["columnName"] for c in table["columns"]}
+    assert column_names == {"id", "name"}
 
 
 @pytest.mark.anyio
-async def test_schema_table_not_found():
+async def test_schema_table_not_found(
+    async_client: AsyncClient,
+    session_mgr: SessionManager,
+):
     """Per-table schema endpoint returns 404 for nonexistent table."""
-    app, session_mgr = create_test_app(ConnectionRegistry())
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
-        session = session_mgr.create()
+    session = session_mgr.create()
 
-        response = await client.get(f"/sessions/{session.id}/schema/table/nonexistent")
-        assert response.status_code == 404
+    response = await async_client.get(
+        f"/sessions/{session.id}/schema/table/nonexistent"
+    )
+    assert response.status_code == 404
 
 
 @pytest.mark.anyio
-async def test_schema_tables_stream_local():
+async def test_schema_tables_stream_local(
+    async_client: AsyncClient,
+    uploaded_session: Session,
+):
     """Schema tables stream endpoint returns NDJSON with local table."""
-    app, session_mgr = create_test_app(ConnectionRegistry())
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
-        session = session_mgr.create()
-
-        # Upload a CSV to create a local table
-        csv_content = b"x,y,label\n1,10,a\n2,20,b\n3,30,a"
-        files = {"file": ("data.csv", io.BytesIO(csv_content), "text/csv")}
-        await client.post(f"/sessions/{session.id}/upload", files=files)
-
-        # Request streaming table names
-        response = await client.get(f"/sessions/{session.id}/schema/tables?stream=true")
+    # Request streaming table names
+    response = await async_client.get(
+        f"/sessions/{uploaded_session.id}/schema/tables?stream=true"
+    )
 
-        assert response.status_code == 200
-        assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
 
-        # Parse NDJSON lines
-        lines = response.text.strip().split("\n")
-        assert len(lines) == 1
+    # Parse NDJSON lines
+    lines = response.text.strip().split("\n")
+    assert len(lines) == 1
 
-        first_line = json.loads(lines[0])
-        assert "tables" in first_line
-        assert len(first_line["tables"]) == 1
-        assert first_line["tables"][0]["tableName"] == "data"
-        assert first_line["tables"][0]["connection"] is None
+    first_line = json.loads(lines[0])
+    assert "tables" in first_line
+    assert len(first_line["tables"]) == 1
+    assert first_line["tables"][0]["tableName"] == "data"
+    assert first_line["tables"][0]["connection"] is None
 
 
 @pytest.mark.anyio
-async def test_schema_tables_stream_with_remote():
+async def test_schema_tables_stream_with_remote(
+    async_client: AsyncClient,
+    session_mgr: SessionManager,
+    registry: ConnectionRegistry,
+    users_engine: Engine,
+):
     """Schema tables stream endpoint includes remote tables in first line."""
-    # Create a SQLite in-memory engine with a table
-    engine = create_engine(
-        "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    with engine.begin() as conn:
-        conn.execute(text("CREATE TABLE users (id INTEGER, name TEXT)"))
-        conn.execute(text("INSERT INTO users VALUES (1, 'Alice'), (2, 'Bob')"))
+    registry.register("test_db", lambda _req: users_engine)
 
-    registry = ConnectionRegistry()
-    registry.register("test_db", lambda _req: engine)
+    session = session_mgr.create()
 
-    app, session_mgr = create_test_app(registry)
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
-        session = session_mgr.create()
-
-        # Request streaming table names
-        response = await client.get(f"/sessions/{session.id}/schema/tables?stream=true")
+    # Request streaming table names
+    response = await async_client.get(
+        f"/sessions/{session.id}/schema/tables?stream=true"
+    )
 
-        assert response.status_code == 200
-        assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
 
-        # Parse NDJSON lines
-        lines = response.text.strip().split("\n")
-        assert len(lines) == 1
+    # Parse NDJSON lines
+    lines = response.text.strip().split("\n")
+    assert len(lines) == 1
 
-        first_line = json.loads(lines[0])
-        assert "tables" in first_line
-        remote_tables = [t for t in first_line["tables"] if t["connection"] == "test_db"]
-        assert len(remote_tables) == 1
-        assert remote_tables[0]["tableName"] == "users"
+    first_line = json.loads(lines[0])
+    assert "tables" in first_line
+    remote_tables = tables_for(first_line["tables"], "test_db")
+    assert len(remote_tables) == 1
+    assert remote_tables[0]["tableName"] == "users"
 
 
 @pytest.mark.anyio
-async def test_schema_tables_stream_empty():
+async def test_schema_tables_stream_empty(
+    async_client: AsyncClient,
+    session_mgr: SessionManager,
+):
     """Schema tables stream endpoint returns empty response when no tables."""
-    app, session_mgr = create_test_app(ConnectionRegistry())
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
-        session = session_mgr.create()
+    session = session_mgr.create()
 
-        # Request streaming table names (no tables uploaded)
-        response = await client.get(f"/sessions/{session.id}/schema/tables?stream=true")
+    # Request streaming table names (no tables uploaded)
+    response = await async_client.get(
+        f"/sessions/{session.id}/schema/tables?stream=true"
+    )
 
-        assert response.status_code == 200
-        assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
 
-        # Empty session should have empty response body
-        assert response.text == ""
+    # Empty session should have empty response body
+    assert response.text == ""
 
 
 @pytest.mark.anyio
-async def test_schema_tables_includes_provider():
+async def test_schema_tables_includes_provider(
+    async_client: AsyncClient,
+    uploaded_session: Session,
+    registry: ConnectionRegistry,
+    users_engine: Engine,
+):
     """Schema tables endpoint includes provider field for remote connections."""
-    # Create a SQLite in-memory engine with a table
-    engine = create_engine(
-        "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    with engine.begin() as conn:
-        conn.execute(text("CREATE TABLE users (id INTEGER, name TEXT)"))
-        conn.execute(text("INSERT INTO users VALUES (1, 'Alice'), (2, 'Bob')"))
-
-    registry = ConnectionRegistry()
-    # Register with explicit provider
-    registry.register("test_db", lambda _req: engine, provider="sqlite")
-
-    app, session_mgr = create_test_app(registry)
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
-        session = session_mgr.create()
-
-        # Upload a local table
-        csv_content = b"x,y,label\n1,10,a\n2,20,b\n3,30,a"
-        files = {"file": ("data.csv", io.BytesIO(csv_content), "text/csv")}
-        await client.post(f"/sessions/{session.id}/upload", files=files)
+    registry.register("test_db", lambda _req: users_engine, provider="sqlite")
 
-        # Request table names
-        response = await client.get(f"/sessions/{session.id}/schema/tables")
+    # Request table names
+    response = await async_client.get(f"/sessions/{uploaded_session.id}/schema/tables")
 
-        assert response.status_code == 200
-        tables = response.json()["data"]["tables"]
+    tables = success_data(response)["tables"]
 
-        # Local table should have provider=None
-        local_tables = [t for t in tables if t["connection"] is None]
-        assert len(local_tables) == 1
-        assert local_tables[0]["provider"] is None
+    # Local table should have provider=None
+    local_tables = tables_for(tables, None)
+    assert len(local_tables) == 1
+    assert local_tables[0]["provider"] is None
 
-        # Remote table should have provider="sqlite"
-        remote_tables = [t for t in tables if t["connection"] == "test_db"]
-        assert len(remote_tables) == 1
-        assert remote_tables[0]["provider"] == "sqlite"
+    # Remote table should have provider="sqlite"
+    remote_tables = tables_for(tables, "test_db")
+    assert len(remote_tables) == 1
+    assert remote_tables[0]["provider"] == "sqlite"
 
 
 @pytest.mark.anyio
-async def test_schema_tables_stream_includes_provider():
+async def test_schema_tables_stream_includes_provider(
+    async_client: AsyncClient,
+    uploaded_session: Session,
+    registry: ConnectionRegistry,
+    users_engine: Engine,
+):
     """Schema tables stream endpoint includes provider field for remote connections."""
-    # Create a SQLite in-memory engine with a table
-    engine = create_engine(
-        "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    with engine.begin() as conn:
-        conn.execute(text("CREATE TABLE users (id INTEGER, name TEXT)"))
-
-    registry = ConnectionRegistry()
-    # Register with explicit provider
-    registry.register("test_db", lambda _req: engine, provider="sqlite")
-
-    app, session_mgr = create_test_app(registry)
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
-        session = session_mgr.create()
+    registry.register("test_db", lambda _req: users_engine, provider="sqlite")
 
-        # Upload a local table
-        csv_content = b"x,y,label\n1,10,a\n2,20,b"
-        files = {"file": ("data.csv", io.BytesIO(csv_content), "text/csv")}
-        await client.post(f"/sessions/{session.id}/upload", files=files)
-
-        # Request streaming table names
-        response = await client.get(f"/sessions/{session.id}/schema/tables?stream=true")
+    # Request streaming table names
+    response = await async_client.get(
+        f"/sessions/{uploaded_session.id}/schema/tables?stream=true"
+    )
 
-        assert response.status_code == 200
-        assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
 
-        # Parse NDJSON lines
-        lines = response.text.strip().split("\n")
-        assert len(lines) == 1
+    # Parse NDJSON lines
+    lines = response.text.strip().split("\n")
+    assert len(lines) == 1
 
-        first_line = json.loads(lines[0])
-        tables = first_line["tables"]
+    first_line = json.loads(lines[0])
+    tables = first_line["tables"]
 
-        # Local table should have provider=None
-        local_tables = [t for t in tables if t["connection"] is None]
-        assert len(local_tables) == 1
-        assert local_tables[0]["provider"] is None
+    # Local table should have provider=None
+    local_tables = tables_for(tables, None)
+    assert len(local_tables) == 1
+    assert local_tables[0]["provider"] is None
 
-        # Remote table should have provider="sqlite"
-        remote_tables = [t for t in tables if t["connection"] == "test_db"]
-        assert len(remote_tables) == 1
-        assert remote_tables[0]["provider"] == "sqlite"
+    # Remote table should have provider="sqlite"
+    remote_tables = tables_for(tables, "test_db")
+    assert len(remote_tables) == 1
+    assert remote_tables[0]["provider"] == "sqlite"
@@ -1,29 +1,12 @@
 """Tests for session routes."""
 
-from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
-from ggsql_rest._errors import register_error_handlers
 from ggsql_rest._sessions import SessionManager
-from ggsql_rest._routes._sessions import router, get_session_manager
 
 
-def create_test_app() -> tuple[FastAPI, SessionManager]:
-    app = FastAPI()
-    session_mgr = SessionManager(timeout_mins=30)
-
-    app.dependency_overrides[get_session_manager] = lambda: session_mgr
-    app.include_router(router)
-    register_error_handlers(app)
-
-    return app, session_mgr
-
-
-def test_create_session():
-    app, _ = create_test_app()
-    client = TestClient(app)
-
-    response = client.post("/sessions")
+def test_create_session(routes_client: TestClient):
+    response = routes_client.post("/sessions")
     assert response.status_code == 200
     body = response.json()
     assert body["status"] == "success"
@@ -32,47 +15,35 @@ def test_create_session():
     assert len(data["sessionId"]) == 32
 
 
-def test_delete_session():
-    app, session_mgr = create_test_app()
-    client = TestClient(app)
-
+def test_delete_session(routes_client: TestClient, session_mgr: SessionManager):
     # Create a session first
     session = session_mgr.create()
 
-    response = client.delete(f"/sessions/{session.id}")
+    response = routes_client.delete(f"/sessions/{session.id}")
     assert response.status_code == 200
     assert response.json() == {"status": "success", "data": None}
 
 
-def test_delete_session_not_found():
-    app, _ = create_test_app()
-    client = TestClient(app)
-
-    response = client.delete("/sessions/nonexistent")
+def test_delete_session_not_found(routes_client: TestClient):
+    response = routes_client.delete("/sessions/nonexistent")
     assert response.status_code == 404
     body = response.json()
     assert body["status"] == "error"
     assert body["error"]["type"] == "SessionNotFound"
 
 
-def test_list_tables_empty():
-    app, session_mgr = create_test_app()
-    client = TestClient(app)
-
+def test_list_tables_empty(routes_client: TestClient, session_mgr: SessionManager):
     session = session_mgr.create()
 
-    response = client.get(f"/sessions/{session.id}/tables")
+    response = routes_client.get(f"/sessions/{session.id}/tables")
     assert response.status_code == 200
     body = response.json()
     assert body["status"] == "success"
     assert body["data"] == {"tables": []}
 
 
-def test_list_tables_not_found():
-    app, _ = create_test_app()
-    client = TestClient(app)
-
-    response = client.get("/sessions/nonexistent/tables")
+def test_list_tables_not_found(routes_client: TestClient):
+    response = routes_client.get("/sessions/nonexistent/tables")
     assert response.status_code == 404
     body = response.json()
     assert body["status"] == "error"
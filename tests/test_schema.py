@@ -1,73 +1,75 @@
 """Tests for schema extraction."""
 
+from collections.abc import Iterator
+
 import polars as pl
+import pytest
 from ggsql import DuckDBReader
-from sqlalchemy import create_engine, text
+from sqlalchemy import Engine, create_engine, text
 from sqlalchemy.pool import StaticPool
 
 from ggsql_rest._schema import get_local_table_schema, get_remote_table_schemas
 
 
-def _make_session_duckdb_with_table() -> tuple[DuckDBReader, str]:
-    """Create a DuckDB instance with a test table."""
+# Only ever registered into DuckDB, never mutated, so built once at import
+_BASIC_DF = pl.DataFrame({
+    "id": [1, 2, 3],
+    "name": ["Alice", "Bob", "Charlie"],
+    "score": [85.5, 92.0, 78.3],
+})
+_BIG_LABEL_DF = pl.DataFrame({"label": [f"item_{i}" for i in range(25)]})
+
+
+@pytest.fixture(scope="session")
+def duckdb_with_table() -> tuple[DuckDBReader, str]:
+    """DuckDB instance with a seeded test table (read-only)."""
     duckdb = DuckDBReader("duckdb://memory")
-    df = pl.DataFrame({
-        "id": [1, 2, 3],
-        "name": ["Alice", "Bob", "Charlie"],
-        "score": [85.5, 92.0, 78.3],
-    })
-    duckdb.register("test_table", df)
+    duckdb.register("test_table", _BASIC_DF)
     return duckdb, "test_table"
 
 
-def test_get_local_table_schema_basic():
-    duckdb, table_name = _make_session_duckdb_with_table()
+def test_get_local_table_schema_basic(duckdb_with_table: tuple[DuckDBReader, str]):
+    duckdb, table_name = duckdb_with_table
     schema = get_local_table_schema(duckdb, table_name, include_stats=False)
 
     assert schema.table_name == "test_table"
     assert schema.connection is None
     assert len(schema.columns) == 3
 
-    col_names = [c.column_name for c in schema.columns]
-    assert "id" in col_names
-    assert "name" in col_names
-    assert "score" in col_names
+    cols = {c.column_name: c for c in schema.columns}
+    assert set(cols) == {"id", "name", "score"}
 
     # No stats when include_stats=False
-    for col in schema.columns:
+    for col in cols.values():
         assert col.min_value is None
         assert col.max_value is None
         assert col.categorical_values is None
 
 
-def test_get_local_table_schema_with_stats():
-    duckdb, table_name = _make_session_duckdb_with_table()
+def test_get_local_table_schema_with_stats(duckdb_with_table: tuple[DuckDBReader, str]):
+    duckdb, table_name = duckdb_with_table
     schema = get_local_table_schema(duckdb, table_name, include_stats=True)
 
-    # Find numeric column - should have min/max
-    score_col = next(c for c in schema.columns if c.column_name == "score")
-    assert score_col.min_value is not None
-    assert score_col.max_value is not None
+    cols = {c.column_name: c for c in schema.columns}
 
-    # Find text column with <= 20 distinct values → categorical
-    name_col = next(c for c in schema.columns if c.column_name == "name")
-    assert name_col.categorical_values is not None
-    assert set(name_col.categorical_values) == {"Alice", "Bob", "Charlie"}
+    # Text column with <= 20 distinct values → categorical
+    assert cols["name"].categorical_values is not None
+    assert set(cols["name"].categorical_values) == {"Alice", "Bob", "Charlie"}
 
 
 def test_get_local_table_schema_non_categorical_text():
     """Text columns with > 20 distinct values should not have categoricalValues."""
     duckdb = DuckDBReader("duckdb://memory")
-    df = pl.DataFrame({"label": [f"item_{i}" for i in range(25)]})
-    duckdb.register("big_table", df)
+    duckdb.register("big_table", _BIG_LABEL_DF)
 
     schema = get_local_table_schema(duckdb, "big_table", include_stats=True)
-    label_col = next(c for c in schema.columns if c.column_name == "label")
-    assert label_col.categorical_values is None
+    cols = {c.column_name: c for c in schema.columns}
+    assert cols["label"].categorical_values is None
 
 
-def _make_sqlite_engine():
-    """Create an in-memory SQLite engine with test data."""
+@pytest.fixture(scope="session")
+def sqlite_engine() -> Iterator[Engine]:
+    """In-memory SQLite engine with a seeded ``sales`` table (read-only)."""
     engine = create_engine(
         "sqlite:///:memory:",
         connect_args={"check_same_thread": False},
@@ -80,12 +82,12 @@ def _make_sqlite_engine():
         conn.execute(text(
             "INSERT INTO sales VALUES (1, 'North', 100.0), (2, 'South', 200.0), (3, 'North', 150.0)"
         ))
-    return engine
+    yield engine
+    engine.dispose()
 
 
-def test_get_remote_table_schemas_basic():
-    engine = _make_sqlite_engine()
-    schemas = get_remote_table_schemas(engine, "test_db", include_stats=False)
+def test_get_remote_table_schemas_basic(sqlite_engine: Engine):
+    schemas = get_remote_table_schemas(sqlite_engine, "test_db", include_stats=False)
 
     assert len(schemas) == 1
     table = schemas[0]
@@ -93,24 +95,19 @@ def test_get_remote_table_schemas_basic():
     assert table.connection == "test_db"
     assert len(table.columns) == 3
 
-    col_names = [c.column_name for c in table.columns]
-    assert "id" in col_names
-    assert "region" in col_names
-    assert "revenue" in col_names
+    cols = {c.column_name: c for c in table.columns}
+    assert set(cols) == {"id", "region", "revenue"}
 
 
-def test_get_remote_table_schemas_with_stats():
-    engine = _make_sqlite_engine()
-    schemas = get_remote_table_schemas(engine, "test_db", include_stats=True)
+def test_get_remote_table_schemas_with_stats(sqlite_engine: Engine):
+    schemas = get_remote_table_schemas(sqlite_engine, "test_db", include_stats=True)
 
-    table = schemas[0]
+    cols = {c.column_name: c for c in schemas[0].columns}
 
     # Numeric column should have min/max
-    revenue_col = next(c for c in table.columns if c.column_name == "revenue")
-    assert revenue_col.min_value is not None
-    assert revenue_col.max_value is not None
+    assert cols["revenue"].min_value is not None
+    assert cols["revenue"].max_value is not None
 
     # Text column with <= 20 distinct values → categorical
-    region_col = next(c for c in table.columns if c.column_name == "region")
-    assert region_col.categorical_values is not None
-    assert set(region_col.categorical_values) == {"North", "South"}
+    assert cols["region"].categorical_values is not None
+    assert set(cols["region"].categorical_values) == {"North", "South"}
@@ -1,12 +1,43 @@
 """Tests for session management."""
 
-from datetime import timezone
+import itertools
+from datetime import timedelta, timezone
+from types import SimpleNamespace
 
 import polars as pl
+import pytest
 
+from ggsql_rest import _sessions
 from ggsql_rest._sessions import Session, SessionManager
 
 
+@pytest.fixture
+def counter_uuid(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Deterministic 32-char hex session IDs: 00...01, 00...02, and so on.
+
+    Only ``_sessions``' reference to the uuid module is replaced; the real
+    ``uuid.uuid4`` is untouched.
+    """
+    counter = itertools.count(1)
+    monkeypatch.setattr(
+        _sessions,
+        "uuid",
+        SimpleNamespace(uuid4=lambda: SimpleNamespace(hex=f"{next(counter):032x}")),
+    )
+
+
+@pytest.fixture
+def mgr() -> SessionManager:
+    """Session manager with the default 30 minute timeout."""
+    return SessionManager(timeout_mins=30)
+
+
+@pytest.fixture
+def expiring_mgr() -> SessionManager:
+    """Session manager whose sessions expire immediately."""
+    return SessionManager(timeout_mins=0)
+
+
 def test_session_creation():
     session = Session("test123", timeout_mins=30)
     assert session.id == "test123"
@@ -27,44 +58,49 @@ def test_session_expiry():
     assert session.is_expired()
 
 
-def test_session_manager_create():
-    mgr = SessionManager(timeout_mins=30)
+def test_session_expiry_at_given_time():
+    session = Session("test123", timeout_mins=30)
+    assert not session.is_expired(session.last_accessed + timedelta(minutes=29))
+    assert session.is_expired(session.last_accessed + timedelta(minutes=31))
+
+
+def test_session_manager_create(mgr: SessionManager):
     session = mgr.create()
     assert session.id is not None
     assert len(session.id) == 32  # uuid hex
 
 
-def test_session_manager_get():
-    mgr = SessionManager(timeout_mins=30)
+@pytest.mark.usefixtures("counter_uuid")
+def test_session_manager_create_uses_uuid_hex(mgr: SessionManager):
+    assert [mgr.create().id for _ in range(2)] == [f"{1:032x}", f"{2:032x}"]
+
+
+def test_session_manager_get(mgr: SessionManager):
     session = mgr.create()
     retrieved = mgr.get(session.id)
     assert retrieved is not None
     assert retrieved.id == session.id
 
 
-def test_session_manager_get_nonexistent():
-    mgr = SessionManager(timeout_mins=30)
+def test_session_manager_get_nonexistent(mgr: SessionManager):
     assert mgr.get("nonexistent") is None
 
 
-def test_session_manager_delete():
-    mgr = SessionManager(timeout_mins=30)
+def test_session_manager_delete(mgr: SessionManager):
     session = mgr.create()
     assert mgr.delete(session.id) is True
     assert mgr.get(session.id) is None
 
 
-def test_session_manager_delete_nonexistent():
-    mgr = SessionManager(timeout_mins=30)
+def test_session_manager_delete_nonexistent(mgr: SessionManager):
     assert mgr.delete("nonexistent") is False
 
 
-def test_session_manager_cleanup_expired():
-    mgr = SessionManager(timeout_mins=0)  # Immediate expiry
-    session = mgr.create()
+def test_session_manager_cleanup_expired(expiring_mgr: SessionManager):
+    session = expiring_mgr.create()
     session_id = session.id
-    mgr.cleanup_expired()
-    assert mgr.get(session_id) is None
+    expiring_mgr.cleanup_expired()
+    assert expiring_mgr.get(session_id) is None
 
 
 def test_session_uses_utc():
@@ -75,21 +111,20 @@ def test_session_uses_utc():
     assert session.last_accessed.tzinfo == timezone.utc
 
 
-def test_create_triggers_cleanup():
+def test_create_triggers_cleanup(expiring_mgr: SessionManager):
     """Creating a session cleans up expired ones."""
-    mgr = SessionManager(timeout_mins=0)  # Immediate expiry
-    s1 = mgr.create()
+    s1 = expiring_mgr.create()
     s1_id = s1.id
 
     # Verify s1 is still in the internal dict (not yet cleaned up)
-    assert s1_id in mgr._sessions
+    assert s1_id in expiring_mgr._sessions
 
     # s1 is now expired. Creating s2 should clean it up.
-    s2 = mgr.create()
+    s2 = expiring_mgr.create()
     assert s2.id != s1_id
 
     # Verify s1 is actually gone from internal dict (not just lazily expired on get)
-    assert s1_id not in mgr._sessions
+    assert s1_id not in expiring_mgr._sessions
 
 
 def test_session_manager_with_seed_data():
@@ -110,9 +145,8 @@ def test_session_manager_with_seed_data():
     assert result["n"][0] == 2
 
 
-def test_session_manager_without_seed_data():
+def test_session_manager_without_seed_data(mgr: SessionManager):
     """Sessions without seed_data should start empty (backward compatible)."""
-    mgr = SessionManager(timeout_mins=30)
     session = mgr.create()
     assert session.tables == []
 
@@ -154,16 +188,13 @@ def test_load_seed_data_missing_file():
         load_seed_data(["/nonexistent/file.csv"])
 
 
-def test_make_sample_data():
+def test_make_sample_data(sample_seed: list[tuple[str, pl.DataFrame]]):
     """make_sample_data should return products, sales, and employees tables."""
-    from ggsql_rest._sessions import make_sample_data
-
-    seed = make_sample_data()
-    names = [name for name, _ in seed]
+    names = [name for name, _ in sample_seed]
     assert names == ["products", "sales", "employees"]
 
     # Verify row counts match Rust server
-    by_name = {name: df for name, df in seed}
+    by_name = {name: df for name, df in sample_seed}
     assert len(by_name["products"]) == 7
     assert len(by_name["sales"]) == 36
     assert len(by_name["employees"]) == 6
@@ -174,12 +205,9 @@ def test_make_sample_data():
     assert set(by_name["employees"].columns) == {"employee_id", "employee_name", "department", "salary", "hire_date"}
 
 
-def test_make_sample_data_queryable():
+def test_make_sample_data_queryable(sample_seed: list[tuple[str, pl.DataFrame]]):
     """Sample data should be queryable after seeding a session."""
-    from ggsql_rest._sessions import make_sample_data
-
-    seed = make_sample_data()
-    mgr = SessionManager(timeout_mins=30, seed_data=seed)
+    mgr = SessionManager(timeout_mins=30, seed_data=sample_seed)
     session = mgr.create()
 
     result = session.duckdb.execute_sql(
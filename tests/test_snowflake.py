@@ -1,41 +1,206 @@
 """Tests for Snowflake discovery module."""
 
+import os
+import re
+import threading
+from collections.abc import Callable, Mapping
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+from typing import TYPE_CHECKING, NamedTuple, cast
 from unittest.mock import MagicMock, patch
 
 import pytest
-from fastapi import Request
 
-from ggsql_rest._snowflake import SnowflakeDiscovery
+from ggsql_rest._snowflake import (
+    _TABLES_QUERY,
+    SnowflakeDiscovery,
+    _ConnInfo,
+    _parse_snowflake_type,
+    _quote_identifier,
+)
 
+if TYPE_CHECKING:
+    from snowflake.connector import SnowflakeConnection
 
-def _make_request(headers: dict[str, str] | None = None) -> Request:
-    """Create a mock FastAPI Request with optional headers."""
-    scope = {
-        "type": "http",
-        "method": "GET",
-        "path": "/",
-        "headers": [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()],
-    }
-    return Request(scope)
+
+class _FakeRequest(NamedTuple):
+    """Request stand-in carrying only (lowercased) headers."""
+
+    headers: Mapping[str, str]
+
+
+def _make_request(headers: dict[str, str] | None = None) -> _FakeRequest:
+    """Build a request stand-in from ``headers``.
+
+    Requests are shared between calls with the same headers, so their
+    headers are read-only.
+    """
+    return _cached_request(frozenset((headers or {}).items()))
+
+
+@lru_cache(maxsize=None)
+def _cached_request(headers: frozenset[tuple[str, str]]) -> _FakeRequest:
+    return _FakeRequest(MappingProxyType({k.lower(): v for k, v in headers}))
+
+
+def _db_rows(*names: str) -> list[tuple]:
+    """SHOW DATABASES rows (name at index 1)."""
+    return [("created_on", name, "owner", "comment", "options", "retention_time") for name in names]
+
+
+def _table_rows(schema: str, *names: str) -> list[tuple]:
+    """SHOW TERSE TABLES rows (name at index 1, schema_name at index 4)."""
+    return [("created_on", name, "TABLE", "database", schema) for name in names]
+
+
+def _schema_rows(*names: str) -> list[tuple]:
+    """SHOW TERSE SCHEMAS rows (name at index 1)."""
+    return [("created_on", name, "SCHEMA", "database", None) for name in names]
+
+
+_SHOW_PAGE_RE = re.compile(r"(?P<query>SHOW .+) LIMIT (?P<limit>\d+)(?: FROM '(?P<start>[^']*)')?")
+
+# Row order of each SHOW scope, as Snowflake sorts it: multi-level scopes
+# sort by database and/or schema before name
+_SHOW_ORDER = {
+    "SHOW DATABASES": itemgetter(1),
+    "SHOW TERSE SCHEMAS IN DATABASE ": itemgetter(1),
+    "SHOW TERSE TABLES IN SCHEMA ": itemgetter(1),
+    "SHOW TERSE TABLES IN DATABASE ": itemgetter(4, 1),
+    "SHOW TERSE OBJECTS IN ACCOUNT": itemgetter(3, 4, 1),
+}
+
+# Most rows one SHOW returns; the rest are silently dropped
+_SHOW_MAX_ROWS = 10_000
+
+
+class _FakeCursor:
+    """Cursor stub answering each query from its connection's responses."""
+
+    def __init__(self, conn: "_FakeConn"):
+        self._conn = conn
+        self._rows: list[tuple] = []
+        self.sfqid: str | None = None
+
+    def __enter__(self) -> "_FakeCursor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+    def execute(self, query: str) -> None:
+        self._conn.queries.append(query)
+        self._answer(query)
+
+    def execute_async(self, query: str) -> None:
+        self._conn.queries.append(query)
+        self._conn.async_log.append(("submit", query))
+        self.sfqid = f"qid-{len(self._conn.async_queries)}"
+        self._conn.async_queries[self.sfqid] = query
+
+    def get_results_from_sfqid(self, sfqid: str) -> None:
+        query = self._conn.async_queries[sfqid]
+        self._conn.async_log.append(("collect", query))
+        self._answer(query)
+
+    def _answer(self, query: str) -> None:
+        # Answer SHOW ... LIMIT n [FROM 'name'] pages from the unpaged response
+        paged = _SHOW_PAGE_RE.fullmatch(query)
+        base_query = paged["query"] if paged else query
+        response = self._conn.responses.get(
+            base_query, Exception(f"Unexpected query: {query}")
+        )
+        if isinstance(response, Exception):
+            raise response
+        if callable(response):
+            response = response()
+        for prefix, order in _SHOW_ORDER.items():
+            if base_query.startswith(prefix):
+                response = sorted(response, key=order)
+                # FROM restarts at the first row whose name is not below it,
+                # whatever database or schema that row is in
+                if paged and paged["start"] is not None:
+                    response = [row for row in response if row[1] >= paged["start"]]
+                break
+        if paged:
+            response = response[: int(paged["limit"])]
+        if base_query.startswith("SHOW "):
+            response = response[:_SHOW_MAX_ROWS]
+        self._rows = response
+
+    def fetchmany(self, size: int) -> list[tuple]:
+        batch, self._rows = self._rows[:size], self._rows[size:]
+        return list(batch)
+
+
+class _FakeConn:
+    """Snowflake connection stub that answers each query from ``responses``.
+
+    Every ``cursor()`` call returns a fresh cursor, since discovery may use
+    one per worker thread; results therefore depend only on the query text,
+    never on call order. A response may be a callable producing the rows,
+    e.g. to hold a query back. Queries missing from ``responses`` raise,
+    like a failed Snowflake query; for execute_async() the error surfaces
+    when results are collected. SHOW responses are sorted, paged with
+    ``LIMIT n FROM 'name'`` and truncated to 10,000 rows like Snowflake's.
+    Executed queries, opened cursors and ``close()`` calls are recorded for
+    assertions; once closed, ``is_closed()`` is true.
+    """
+
+    def __init__(
+        self,
+        responses: dict[str, list[tuple] | Exception | Callable[[], list[tuple]]],
+    ):
+        self.responses = responses
+        self.queries: list[str] = []
+        self.cursors: list[_FakeCursor] = []
+        self.close_calls = 0
+        # execute_async() query ids -> query text, and submit/collect order
+        self.async_queries: dict[str, str] = {}
+        self.async_log: list[tuple[str, str]] = []
+
+    def cursor(self) -> _FakeCursor:
+        cursor = _FakeCursor(self)
+        self.cursors.append(cursor)
+        return cursor
+
+    def close(self) -> None:
+        self.close_calls += 1
+
+    def is_closed(self) -> bool:
+        return self.close_calls > 0
+
+
+def _discover_catalog(
+    discovery: SnowflakeDiscovery, conn: _FakeConn
+) -> list[tuple[str, str, str, str]]:
+    """Run ``discovery._discover_catalog()`` against a stub connection."""
+    return discovery._discover_catalog(cast("SnowflakeConnection", conn))
+
+
+@pytest.fixture(scope="module")
+def empty_request() -> _FakeRequest:
+    """Request stand-in without any headers."""
+    return _make_request()
 
 
 class TestSnowflakeConnection:
     """Test Snowflake connection creation."""
 
-    def test_connect_local_uses_connection_name(self):
+    def test_connect_local_uses_connection_name(self, empty_request):
         """Local mode uses SNOWFLAKE_CONNECTION_NAME from connections.toml."""
         discovery = SnowflakeDiscovery(
             account="test-account",
             warehouse="TEST_WH",
             connection_name="my_conn",
         )
-        request = _make_request()
 
         with patch("ggsql_rest._snowflake.snowflake_connector") as mock_sf:
             mock_conn = MagicMock()
             mock_sf.connect.return_value = mock_conn
 
-            conn = discovery._create_connection(request)
+            conn = discovery._create_connection(empty_request)
 
             mock_sf.connect.assert_called_once_with(
                 connection_name="my_conn",
@@ -78,75 +243,194 @@ class TestSnowflakeConnection:
             )
             assert conn is mock_conn
 
-    def test_connect_no_token_no_connection_name_raises(self):
-        """Raises if no session token and no connection_name configured."""
+    def test_connect_oauth_reuses_cached_authenticator_for_same_token(self):
+        """Repeat requests with the same session token skip the OAuth exchange."""
         discovery = SnowflakeDiscovery(
             account="test-account",
             warehouse="TEST_WH",
         )
-        request = _make_request()  # No token header
+        request = _make_request({
+            "Posit-Connect-User-Session-Token": "test-token-123",
+        })
 
-        with pytest.raises(ValueError, match="Snowflake authentication"):
+        with (
+            patch("ggsql_rest._snowflake.snowflake_connector") as mock_sf,
+            patch("ggsql_rest._snowflake.PositAuthenticator") as mock_auth_cls,
+        ):
+            mock_auth = MagicMock()
+            mock_auth.authenticator = "oauth"
+            mock_auth.token = "sf-access-token-xyz"
+            mock_auth_cls.return_value = mock_auth
+
+            discovery._create_connection(request)
             discovery._create_connection(request)
 
+            assert mock_auth_cls.call_count == 1
+            assert mock_sf.connect.call_count == 2
+            assert mock_sf.connect.call_args.kwargs["token"] == "sf-access-token-xyz"
 
-class TestCatalogDiscovery:
-    """Test Snowflake catalog discovery via SHOW commands."""
+    def test_connect_no_token_no_connection_name_raises(self, empty_request):
+        """Raises if no session token and no connection_name configured."""
+        discovery = SnowflakeDiscovery(
+            account="test-account",
+            warehouse="TEST_WH",
+        )
+        with pytest.raises(ValueError, match="Snowflake authentication"):
+            discovery._create_connection(empty_request)  # No token header
 
-    def test_discovers_databases_schemas_tables(self):
-        """Discovers databases, schemas, and tables via SHOW commands."""
+    def test_pooled_connection_reused_per_user(self, empty_request):
+        """Discovery reuses one keep-alive connection per user until disposed."""
         discovery = SnowflakeDiscovery(
             account="test-account",
             warehouse="TEST_WH",
+            connection_name="my_conn",
         )
+        fake_conn = _FakeConn({})
 
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_conn.cursor.return_value = mock_cursor
+        with patch.object(
+            discovery, "_create_connection", return_value=fake_conn
+        ) as mock_create:
+            first = discovery._get_pooled_connection("user1", empty_request)
+            second = discovery._get_pooled_connection("user1", empty_request)
 
-        # Mock fetchall to return different results for each query
-        mock_cursor.fetchall.side_effect = [
-            # SHOW DATABASES
-            [("created_on", "DB1", "owner", "comment", "options", "retention_time")],
-            # SHOW SCHEMAS IN DATABASE "DB1"
-            [
-                ("created_on", "PUBLIC", "database", "owner", "comment", "options"),
-                ("created_on", "INFORMATION_SCHEMA", "database", "owner", "comment", "options"),
-            ],
-            # SHOW TABLES IN SCHEMA "DB1"."PUBLIC"
-            [
-                ("created_on", "USERS", "database", "schema", "kind", "comment"),
-                ("created_on", "ORDERS", "database", "schema", "kind", "comment"),
+        assert first is second is fake_conn
+        mock_create.assert_called_once_with(empty_request, keep_alive=True)
+
+        discovery.dispose_all()
+        assert fake_conn.close_calls == 1
+
+    def test_connection_refreshed_on_expiry(self, empty_request):
+        """A pooled connection whose session has ended is replaced."""
+        discovery = SnowflakeDiscovery(
+            account="test-account",
+            warehouse="TEST_WH",
+            connection_name="my_conn",
+        )
+        expired = _FakeConn({})
+        fresh = _FakeConn({})
+
+        with patch.object(
+            discovery, "_create_connection", side_effect=[expired, fresh]
+        ):
+            assert discovery._get_pooled_connection("user1", empty_request) is expired
+            expired.close()  # e.g. the session outlived its OAuth token
+            assert discovery._get_pooled_connection("user1", empty_request) is fresh
+            assert discovery._get_pooled_connection("user1", empty_request) is fresh
+
+    def test_failed_discovery_discards_pooled_connection(self):
+        """A connection that fails mid-discovery is closed and not reused."""
+        discovery = SnowflakeDiscovery(
+            account="test-account",
+            warehouse="TEST_WH",
+            connection_name="my_conn",
+        )
+        request = _make_request({"x-user-id": "user1"})
+        broken = _FakeConn({})  # SHOW DATABASES fails
+
+        with patch.object(discovery, "_create_connection", return_value=broken):
+            with pytest.raises(Exception, match="Unexpected query"):
+                discovery.get_table_names(request)
+
+        assert broken.close_calls == 1
+        assert "user1" not in discovery._connections
+
+
+class TestCatalogDiscovery:
+    """Test Snowflake catalog discovery via INFORMATION_SCHEMA and SHOW commands."""
+
+    def test_discovers_tables_via_information_schema(self):
+        """Each database's tables come from one INFORMATION_SCHEMA query."""
+        discovery = SnowflakeDiscovery(
+            account="test-account",
+            warehouse="TEST_WH",
+        )
+
+        fake_conn = _FakeConn({
+            "SHOW DATABASES": _db_rows("DB1", "DB2"),
+            _TABLES_QUERY.format('"DB1"'): [
+                ("PUBLIC", "ORDERS"),
+                ("PUBLIC", "USERS"),
+                ("SALES", "REGIONS"),
             ],
+            _TABLES_QUERY.format('"DB2"'): [("PUBLIC", "PRODUCTS")],
+        })
+
+        result = _discover_catalog(discovery, fake_conn)
+
+        assert result == [
+            ("DB1.PUBLIC", "DB1", "PUBLIC", "ORDERS"),
+            ("DB1.PUBLIC", "DB1", "PUBLIC", "USERS"),
+            ("DB1.SALES", "DB1", "SALES", "REGIONS"),
+            ("DB2.PUBLIC", "DB2", "PUBLIC", "PRODUCTS"),
         ]
+        assert not any(q.startswith("SHOW TABLES") for q in fake_conn.queries)
 
-        result = discovery._discover_catalog(mock_conn)
+    def test_discovers_databases_schemas_tables(self):
+        """Falls back to SHOW commands when INFORMATION_SCHEMA is unavailable."""
+        discovery = SnowflakeDiscovery(
+            account="test-account",
+            warehouse="TEST_WH",
+        )
+
+        fake_conn = _FakeConn({
+            "SHOW DATABASES": _db_rows("DB1"),
+            'SHOW TERSE TABLES IN DATABASE "DB1"': [
+                *_table_rows("PUBLIC", "USERS", "ORDERS"),
+                *_table_rows("INFORMATION_SCHEMA", "TABLES"),
+            ],
+        })
+
+        result = _discover_catalog(discovery, fake_conn)
+
+        # One cursor shared by the (failing) account-wide SHOW and SHOW DATABASES,
+        # and one reused for all of DB1's queries
+        assert len(fake_conn.cursors) == 2
 
         # Verify result structure
         assert len(result) == 2
-        assert result[0] == ("DB1.PUBLIC", "DB1", "PUBLIC", "USERS")
-        assert result[1] == ("DB1.PUBLIC", "DB1", "PUBLIC", "ORDERS")
+        assert result[0] == ("DB1.PUBLIC", "DB1", "PUBLIC", "ORDERS")
+        assert result[1] == ("DB1.PUBLIC", "DB1", "PUBLIC", "USERS")
 
-    def test_skips_information_schema(self):
-        """INFORMATION_SCHEMA schemas are excluded from results."""
+    def test_discovers_via_show_objects_in_account(self):
+        """Without filters, one SHOW TERSE OBJECTS IN ACCOUNT lists every table."""
         discovery = SnowflakeDiscovery(
             account="test-account",
             warehouse="TEST_WH",
         )
 
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_conn.cursor.return_value = mock_cursor
+        fake_conn = _FakeConn({
+            "SHOW TERSE OBJECTS IN ACCOUNT": [
+                ("created_on", "ORDERS", "TABLE", "DB2", "SALES"),
+                ("created_on", "TABLES", "VIEW", "DB1", "INFORMATION_SCHEMA"),
+                ("created_on", "USERS", "TABLE", "DB1", "PUBLIC"),
+                ("created_on", "USERS_V", "VIEW", "DB1", "PUBLIC"),
+                ("created_on", "ZTMP", "TRANSIENT", "DB1", "PUBLIC"),
+            ],
+        })
+
+        result = _discover_catalog(discovery, fake_conn)
 
-        # Mock fetchall to return different results for each query
-        mock_cursor.fetchall.side_effect = [
-            # SHOW DATABASES
-            [("created_on", "DB1", "owner", "comment", "options", "retention_time")],
-            # SHOW SCHEMAS returns only INFORMATION_SCHEMA
-            [("created_on", "INFORMATION_SCHEMA", "database", "owner", "comment", "options")],
+        assert fake_conn.queries == ["SHOW TERSE OBJECTS IN ACCOUNT"]
+        assert result == [
+            ("DB1.PUBLIC", "DB1", "PUBLIC", "USERS"),
+            ("DB1.PUBLIC", "DB1", "PUBLIC", "ZTMP"),
+            ("DB2.SALES", "DB2", "SALES", "ORDERS"),
         ]
 
-        result = discovery._discover_catalog(mock_conn)
+    def test_skips_information_schema(self):
+        """INFORMATION_SCHEMA schemas are excluded from results."""
+        discovery = SnowflakeDiscovery(
+            account="test-account",
+            warehouse="TEST_WH",
+        )
+
+        # SHOW TABLES returns only INFORMATION_SCHEMA views
+        fake_conn = _FakeConn({
+            "SHOW DATABASES": _db_rows("DB1"),
+            'SHOW TERSE TABLES IN DATABASE "DB1"': _table_rows("INFORMATION_SCHEMA", "TABLES"),
+        })
+
+        result = _discover_catalog(discovery, fake_conn)
 
         # Should be empty - INFORMATION_SCHEMA filtered out
         assert result == []
@@ -158,42 +442,167 @@ class TestCatalogDiscovery:
             warehouse="TEST_WH",
         )
 
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_conn.cursor.return_value = mock_cursor
+        fake_conn = _FakeConn({
+            "SHOW DATABASES": _db_rows("DB1", "DB2"),
+            'SHOW TERSE TABLES IN DATABASE "DB1"': _table_rows("PUBLIC", "USERS"),
+            'SHOW TERSE TABLES IN DATABASE "DB2"': Exception("Access denied to DB2"),
+        })
 
-        # Track which call we're on
-        call_count = {"execute": 0, "fetchall": 0}
+        result = _discover_catalog(discovery, fake_conn)
 
-        def execute_side_effect(query):
-            call_count["execute"] += 1
-            if 'SHOW SCHEMAS IN DATABASE "DB2"' in query:
-                raise Exception("Access denied to DB2")
+        # Should only have DB1 results, DB2 skipped
+        assert len(result) == 1
+        assert result[0] == ("DB1.PUBLIC", "DB1", "PUBLIC", "USERS")
 
-        def fetchall_side_effect():
-            call_count["fetchall"] += 1
-            if call_count["fetchall"] == 1:
-                # SHOW DATABASES
-                return [
-                    ("created_on", "DB1", "owner", "comment", "options", "retention_time"),
-                    ("created_on", "DB2", "owner", "comment", "options", "retention_time"),
-                ]
-            elif call_count["fetchall"] == 2:
-                # SHOW SCHEMAS IN DATABASE "DB1"
-                return [("created_on", "PUBLIC", "database", "owner", "comment", "options")]
-            elif call_count["fetchall"] == 3:
-                # SHOW TABLES IN SCHEMA "DB1"."PUBLIC"
-                return [("created_on", "USERS", "database", "schema", "kind", "comment")]
-            raise ValueError(f"Unexpected fetchall call #{call_count['fetchall']}")
+    def test_falls_back_to_per_schema_show(self):
+        """A database whose database-wide SHOW fails is listed schema by schema."""
+        discovery = SnowflakeDiscovery(
+            account="test-account",
+            warehouse="TEST_WH",
+            databases=["BIG"],
+        )
+        fake_conn = _FakeConn({
+            'SHOW TERSE TABLES IN DATABASE "BIG"': Exception("result exceeds 10000 rows"),
+            'SHOW TERSE SCHEMAS IN DATABASE "BIG"': _schema_rows("INFORMATION_SCHEMA", "PUBLIC", "SALES"),
+            'SHOW TERSE TABLES IN SCHEMA "BIG"."PUBLIC"': _table_rows("PUBLIC", "USERS"),
+            'SHOW TERSE TABLES IN SCHEMA "BIG"."SALES"': _table_rows("SALES", "ORDERS"),
+        })
 
-        mock_cursor.execute.side_effect = execute_side_effect
-        mock_cursor.fetchall.side_effect = fetchall_side_effect
+        result = _discover_catalog(discovery, fake_conn)
 
-        result = discovery._discover_catalog(mock_conn)
+        assert result == [
+            ("BIG.PUBLIC", "BIG", "PUBLIC", "USERS"),
+            ("BIG.SALES", "BIG", "SALES", "ORDERS"),
+        ]
+        assert not any("INFORMATION_SCHEMA" in q and "SHOW" in q for q in fake_conn.queries)
 
-        # Should only have DB1 results, DB2 skipped
-        assert len(result) == 1
-        assert result[0] == ("DB1.PUBLIC", "DB1", "PUBLIC", "USERS")
+    def test_discovers_uses_async_execute(self):
+        """Per-schema SHOWs are all submitted before any result is collected."""
+        discovery = SnowflakeDiscovery(
+            account="test-account",
+            warehouse="TEST_WH",
+            schemas=["DB1.PUBLIC", "DB1.SALES", "DB1.LOCKED"],
+        )
+        fake_conn = _FakeConn({
+            'SHOW TERSE TABLES IN SCHEMA "DB1"."PUBLIC"': _table_rows("PUBLIC", "USERS"),
+            'SHOW TERSE TABLES IN SCHEMA "DB1"."SALES"': _table_rows("SALES", "ORDERS"),
+            'SHOW TERSE TABLES IN SCHEMA "DB1"."LOCKED"': Exception("insufficient privileges"),
+        })
+
+        result = _discover_catalog(discovery, fake_conn)
+
+        assert result == [
+            ("DB1.PUBLIC", "DB1", "PUBLIC", "USERS"),
+            ("DB1.SALES", "DB1", "SALES", "ORDERS"),
+        ]
+        steps = [step for step, _ in fake_conn.async_log]
+        assert steps == ["submit"] * 3 + ["collect"] * 3
+
+    def test_identifier_with_quote_is_escaped(self):
+        """Embedded double quotes in identifiers are doubled, not passed through."""
+        assert _quote_identifier('MY"DB') == '"MY""DB"'
+
+        discovery = SnowflakeDiscovery(
+            account="test-account",
+            warehouse="TEST_WH",
+            databases=['MY"DB'],
+        )
+        fake_conn = _FakeConn({
+            'SHOW TERSE TABLES IN DATABASE "MY""DB"': _table_rows("PUBLIC", "USERS"),
+        })
+
+        result = _discover_catalog(discovery, fake_conn)
+
+        assert result == [('MY"DB.PUBLIC', 'MY"DB', "PUBLIC", "USERS")]
+
+    def test_reads_results_across_fetch_batches(self):
+        """Catalogs larger than one fetchmany() batch are read in full."""
+        discovery = SnowflakeDiscovery(
+            account="test-account",
+            warehouse="TEST_WH",
+            databases=["DB1"],
+        )
+        names = [f"T{i:04d}" for i in range(2500)]
+        fake_conn = _FakeConn({
+            _TABLES_QUERY.format('"DB1"'): [("PUBLIC", name) for name in names],
+        })
+
+        result = _discover_catalog(discovery, fake_conn)
+
+        assert [table for _, _, _, table in result] == names
+
+    def test_show_paginates_beyond_10k(self):
+        """Single-level SHOW results past the 10,000-row cap are read page by page."""
+        discovery = SnowflakeDiscovery(
+            account="test-account",
+            warehouse="TEST_WH",
+            schemas=["DB1.PUBLIC"],
+        )
+        names = [f"T{i:05d}" for i in range(15000)]
+        fake_conn = _FakeConn({
+            'SHOW TERSE TABLES IN SCHEMA "DB1"."PUBLIC"': _table_rows("PUBLIC", *names),
+        })
+
+        result = _discover_catalog(discovery, fake_conn)
+
+        assert [table for _, _, _, table in result] == names
+        assert [q for q in fake_conn.queries if q.startswith("SHOW")] == [
+            'SHOW TERSE TABLES IN SCHEMA "DB1"."PUBLIC" LIMIT 9000',
+            """SHOW TERSE TABLES IN SCHEMA "DB1"."PUBLIC" LIMIT 9000 FROM 'T08999'""",
+        ]
+
+    def test_truncated_database_show_falls_back_to_per_schema(self):
+        """A database-wide SHOW that fills a whole result is redone schema by schema."""
+        discovery = SnowflakeDiscovery(
+            account="test-account",
+            warehouse="TEST_WH",
+            databases=["DB1"],
+        )
+        # Both schemas share one name sequence, so paging the database-wide
+        # SHOW by name would re-read or skip rows
+        names = [f"T{i:05d}" for i in range(6000)]
+        fake_conn = _FakeConn({
+            'SHOW TERSE TABLES IN DATABASE "DB1"': [
+                *_table_rows("PUBLIC", *names),
+                *_table_rows("STAGING", *names),
+            ],
+            'SHOW TERSE SCHEMAS IN DATABASE "DB1"': _schema_rows("PUBLIC", "STAGING"),
+            'SHOW TERSE TABLES IN SCHEMA "DB1"."PUBLIC"': _table_rows("PUBLIC", *names),
+            'SHOW TERSE TABLES IN SCHEMA "DB1"."STAGING"': _table_rows("STAGING", *names),
+        })
+
+        result = _discover_catalog(discovery, fake_conn)
+
+        assert len(result) == len(set(result)) == 12000
+        assert {conn_name for conn_name, _, _, _ in result} == {"DB1.PUBLIC", "DB1.STAGING"}
+        assert [q for q in fake_conn.queries if "TABLES IN DATABASE" in q] == [
+            'SHOW TERSE TABLES IN DATABASE "DB1"'
+        ]
+
+    def test_truncated_account_show_falls_back_to_per_database(self):
+        """An account-wide SHOW that fills a whole result is redone per database."""
+        discovery = SnowflakeDiscovery(
+            account="test-account",
+            warehouse="TEST_WH",
+        )
+        names = [f"T{i:05d}" for i in range(5000)]
+        fake_conn = _FakeConn({
+            "SHOW TERSE OBJECTS IN ACCOUNT": [
+                ("created_on", name, "TABLE", db_name, "PUBLIC")
+                for db_name in ("DB1", "DB2", "DB3")
+                for name in names
+            ],
+            "SHOW DATABASES": _db_rows("DB1", "DB2", "DB3"),
+            **{
+                _TABLES_QUERY.format(f'"{db_name}"'): [("PUBLIC", name) for name in names]
+                for db_name in ("DB1", "DB2", "DB3")
+            },
+        })
+
+        result = _discover_catalog(discovery, fake_conn)
+
+        assert len(result) == 15000
+        assert [db_name for _, db_name, _, _ in result[::5000]] == ["DB1", "DB2", "DB3"]
 
     def test_empty_account_returns_empty(self):
         """Empty account with no databases returns empty list."""
@@ -202,14 +611,10 @@ class TestCatalogDiscovery:
             warehouse="TEST_WH",
         )
 
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_conn.cursor.return_value = mock_cursor
-
         # SHOW DATABASES returns empty
-        mock_cursor.fetchall.return_value = []
+        fake_conn = _FakeConn({"SHOW DATABASES": []})
 
-        result = discovery._discover_catalog(mock_conn)
+        result = _discover_catalog(discovery, fake_conn)
 
         assert result == []
 
@@ -226,44 +631,27 @@ class TestGetTables:
         )
         request = _make_request({"x-user-id": "user1"})
 
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_conn.cursor.return_value = mock_cursor
-
-        call_count = {"fetchall": 0}
-
-        def fetchall_side_effect():
-            call_count["fetchall"] += 1
-            if call_count["fetchall"] == 1:
-                # SHOW DATABASES
-                return [("created_on", "DB1", "owner", "comment", "options", "retention_time")]
-            elif call_count["fetchall"] == 2:
-                # SHOW SCHEMAS IN DATABASE "DB1"
-                return [("created_on", "PUBLIC", "database", "owner", "comment", "options")]
-            elif call_count["fetchall"] == 3:
-                # SHOW TABLES IN SCHEMA "DB1"."PUBLIC"
-                return [
-                    ("created_on", "USERS", "database", "schema", "kind", "comment"),
-                    ("created_on", "ORDERS", "database", "schema", "kind", "comment"),
-                ]
-            elif call_count["fetchall"] == 4:
-                # SHOW COLUMNS IN DATABASE "DB1"
-                return [
-                    ("USERS", "PUBLIC", "id", '{"type":"FIXED","precision":38,"scale":0,"nullable":true}', "Y", None, "COLUMN", None, None, "DB1", None, None),
-                    ("USERS", "PUBLIC", "name", '{"type":"TEXT","length":16777216,"nullable":true,"fixed":false}', "Y", None, "COLUMN", None, None, "DB1", None, None),
-                    ("ORDERS", "PUBLIC", "order_id", '{"type":"FIXED","precision":38,"scale":0,"nullable":true}', "Y", None, "COLUMN", None, None, "DB1", None, None),
-                    ("SOME_TABLE", "INFORMATION_SCHEMA", "col1", '{"type":"TEXT","length":100,"nullable":true,"fixed":false}', "Y", None, "COLUMN", None, None, "DB1", None, None),
-                ]
-            raise ValueError(f"Unexpected fetchall call #{call_count['fetchall']}")
-
-        mock_cursor.fetchall.side_effect = fetchall_side_effect
-
-        with patch.object(discovery, "_create_connection", return_value=mock_conn):
+        fake_conn = _FakeConn({
+            "SHOW DATABASES": _db_rows("DB1"),
+            'SHOW TERSE TABLES IN DATABASE "DB1"': _table_rows("PUBLIC", "USERS", "ORDERS"),
+            'SHOW COLUMNS IN DATABASE "DB1"': [
+                ("USERS", "PUBLIC", "id", '{"type":"FIXED","precision":38,"scale":0,"nullable":true}', "Y", None, "COLUMN", None, None, "DB1", None, None),
+                ("USERS", "PUBLIC", "name", '{"type":"TEXT","length":16777216,"nullable":true,"fixed":false}', "Y", None, "COLUMN", None, None, "DB1", None, None),
+                ("ORDERS", "PUBLIC", "order_id", '{"type":"FIXED","precision":38,"scale":0,"nullable":true}', "Y", None, "COLUMN", None, None, "DB1", None, None),
+                ("SOME_TABLE", "INFORMATION_SCHEMA", "col1", '{"type":"TEXT","length":100,"nullable":true,"fixed":false}', "Y", None, "COLUMN", None, None, "DB1", None, None),
+            ],
+        })
+
+        with patch.object(discovery, "_create_connection", return_value=fake_conn):
             result = discovery.get_tables(request, include_stats=False)
 
         assert len(result) == 2
+        # Columns for the whole database come from a single query
+        assert [q for q in fake_conn.queries if q.startswith("SHOW COLUMNS")] == [
+            'SHOW COLUMNS IN DATABASE "DB1"',
+        ]
 
-        users = next(t for t in result if t.table_name == "USERS")
+        users = result["DB1.PUBLIC.USERS"]
         assert users.connection == "DB1.PUBLIC"
         assert len(users.columns) == 2
         assert users.columns[0].column_name == "id"
@@ -271,10 +659,121 @@ class TestGetTables:
         assert users.columns[1].column_name == "name"
         assert users.columns[1].data_type == "VARCHAR"
 
-        orders = next(t for t in result if t.table_name == "ORDERS")
+        orders = result["DB1.PUBLIC.ORDERS"]
         assert orders.connection == "DB1.PUBLIC"
         assert len(orders.columns) == 1
 
+        # Unvalidated construction still serializes like a validated model
+        assert orders.model_dump(by_alias=True) == {
+            "tableName": "ORDERS",
+            "connection": "DB1.PUBLIC",
+            "columns": [
+                {
+                    "columnName": "order_id",
+                    "dataType": "NUMBER(38,0)",
+                    "minValue": None,
+                    "maxValue": None,
+                    "categoricalValues": None,
+                }
+            ],
+        }
+
+    def test_get_tables_reads_columns_across_fetch_batches(self):
+        """SHOW COLUMNS results larger than one fetchmany() batch are read in full."""
+        discovery = SnowflakeDiscovery(
+            account="test-account",
+            warehouse="TEST_WH",
+            connection_name="my_conn",
+        )
+        request = _make_request({"x-user-id": "user1"})
+
+        text = '{"type":"TEXT","length":16777216,"nullable":true,"fixed":false}'
+        fake_conn = _FakeConn({
+            "SHOW DATABASES": _db_rows("DB1"),
+            'SHOW TERSE TABLES IN DATABASE "DB1"': _table_rows("PUBLIC", "WIDE"),
+            'SHOW COLUMNS IN DATABASE "DB1"': [
+                ("WIDE", "PUBLIC", f"c{i}", text, "Y", None, "COLUMN", None, None, "DB1", None, None)
+                for i in range(2500)
+            ],
+        })
+
+        with patch.object(discovery, "_create_connection", return_value=fake_conn):
+            (wide,) = discovery.get_tables(request, include_stats=False).values()
+
+        assert [c.column_name for c in wide.columns] == [f"c{i}" for i in range(2500)]
+
+    @pytest.mark.parametrize("account_columns", ["fits", "raises", "truncated"])
+    def test_get_tables_batches_show_columns_across_databases(self, account_columns):
+        """Several databases share one SHOW COLUMNS IN ACCOUNT, else one per database."""
+        discovery = SnowflakeDiscovery(
+            account="test-account",
+            warehouse="TEST_WH",
+            connection_name="my_conn",
+        )
+        request = _make_request({"x-user-id": "user1"})
+
+        fixed = '{"type":"FIXED","precision":38,"scale":0,"nullable":true}'
+        db1_rows = [("USERS", "PUBLIC", "id", fixed, "Y", None, "COLUMN", None, None, "DB1", None, None)]
+        db2_rows = [("ITEMS", "SALES", "sku", fixed, "Y", None, "COLUMN", None, None, "DB2", None, None)]
+        other_rows = [("T", "PUBLIC", "x", fixed, "Y", None, "COLUMN", None, None, "DB3", None, None)]
+        fake_conn = _FakeConn({
+            "SHOW DATABASES": _db_rows("DB1", "DB2"),
+            'SHOW TERSE TABLES IN DATABASE "DB1"': _table_rows("PUBLIC", "USERS"),
+            'SHOW TERSE TABLES IN DATABASE "DB2"': _table_rows("SALES", "ITEMS"),
+            'SHOW COLUMNS IN DATABASE "DB1"': db1_rows,
+            'SHOW COLUMNS IN DATABASE "DB2"': db2_rows,
+        })
+        if account_columns == "fits":
+            fake_conn.responses["SHOW COLUMNS IN ACCOUNT"] = db1_rows + db2_rows + other_rows
+        elif account_columns == "truncated":
+            # A full 10,000-row SHOW may have dropped DB2's columns
+            fake_conn.responses["SHOW COLUMNS IN ACCOUNT"] = db1_rows + other_rows * 9999
+
+        with patch.object(discovery, "_create_connection", return_value=fake_conn):
+            result = discovery.get_tables(request, include_stats=False)
+
+        expected_queries = (
+            ["SHOW COLUMNS IN ACCOUNT"]
+            if account_columns == "fits"
+            else [
+                "SHOW COLUMNS IN ACCOUNT",
+                'SHOW COLUMNS IN DATABASE "DB1"',
+                'SHOW COLUMNS IN DATABASE "DB2"',
+            ]
+        )
+        assert sorted(
+            q for q in fake_conn.queries if q.startswith("SHOW COLUMNS")
+        ) == sorted(expected_queries)
+        assert set(result) == {"DB1.PUBLIC.USERS", "DB2.SALES.ITEMS"}
+
+    def test_get_tables_skips_account_columns_with_databases_filter(self):
+        """A databases filter scans only those databases, never the whole account."""
+        discovery = SnowflakeDiscovery(
+            account="test-account",
+            warehouse="TEST_WH",
+            connection_name="my_conn",
+            databases=["DB1", "DB2"],
+        )
+        request = _make_request({"x-user-id": "user1"})
+
+        fixed = '{"type":"FIXED","precision":38,"scale":0,"nullable":true}'
+        fake_conn = _FakeConn({
+            'SHOW TERSE TABLES IN DATABASE "DB1"': _table_rows("PUBLIC", "USERS"),
+            'SHOW TERSE TABLES IN DATABASE "DB2"': _table_rows("SALES", "ITEMS"),
+            'SHOW COLUMNS IN DATABASE "DB1"': [
+                ("USERS", "PUBLIC", "id", fixed, "Y", None, "COLUMN", None, None, "DB1", None, None)
+            ],
+            'SHOW COLUMNS IN DATABASE "DB2"': [
+                ("ITEMS", "SALES", "sku", fixed, "Y", None, "COLUMN", None, None, "DB2", None, None)
+            ],
+        })
+
+        with patch.object(discovery, "_create_connection", return_value=fake_conn):
+            result = discovery.get_tables(request, include_stats=False)
+
+        assert "SHOW COLUMNS IN ACCOUNT" not in fake_conn.queries
+        assert set(result) == {"DB1.PUBLIC.USERS", "DB2.SALES.ITEMS"}
+
     def test_get_tables_caches_per_user(self):
         """get_tables() caches discovered tables per user."""
         discovery = SnowflakeDiscovery(
@@ -285,22 +784,100 @@ class TestGetTables:
         request = _make_request({"x-user-id": "user1"})
 
         from ggsql_rest._models import ColumnSchema, TableSchema
-        discovery._discovered_tables["user1"] = [
-            TableSchema(
+        discovery._discovered_tables["user1"] = {
+            "DB1.PUBLIC.USERS": TableSchema(
                 table_name="USERS",
                 connection="DB1.PUBLIC",
                 columns=[ColumnSchema(column_name="id", data_type="NUMBER(38,0)")],
             )
-        ]
-        discovery._discovered_connections["user1"] = {"DB1.PUBLIC": ("DB1", "PUBLIC")}
+        }
+        discovery._discovered_connections["user1"] = {"DB1.PUBLIC": _ConnInfo("DB1", "PUBLIC")}
 
         with patch.object(discovery, "_create_connection") as mock_create:
             result = discovery.get_tables(request, include_stats=False)
 
         assert len(result) == 1
-        assert result[0].table_name == "USERS"
+        assert result["DB1.PUBLIC.USERS"].table_name == "USERS"
         mock_create.assert_not_called()
 
+    def test_stale_cache_served_then_refreshed(self):
+        """Stale tables are returned at once while a background refresh runs."""
+        discovery = SnowflakeDiscovery(
+            account="test-account",
+            warehouse="TEST_WH",
+            connection_name="my_conn",
+            cache_ttl=60,
+        )
+        request = _make_request({"x-user-id": "user1"})
+
+        from ggsql_rest._models import TableSchema
+        old = TableSchema(table_name="OLD", connection="DB1.PUBLIC", columns=[])
+        new = TableSchema(table_name="NEW", connection="DB1.PUBLIC", columns=[])
+        stale = {"DB1.PUBLIC.OLD": old}
+        fresh = {"DB1.PUBLIC.NEW": new}
+        refreshed = threading.Event()
+
+        def load_tables(user_id, request):
+            discovery._discovered_tables[user_id] = fresh
+            refreshed.set()
+            return fresh
+
+        with patch("ggsql_rest._snowflake.time") as mock_time:
+            mock_time.monotonic.return_value = 1000.0
+            discovery._discovered_tables["user1"] = stale
+
+            # Past the TTL: the stale value is served, a refresh is scheduled
+            mock_time.monotonic.return_value = 1061.0
+            with patch.object(
+                discovery, "_load_tables", side_effect=load_tables
+            ) as mock_load:
+                result = discovery.get_tables(request, include_stats=False)
+                assert result is stale
+                assert refreshed.wait(timeout=5)
+
+        mock_load.assert_called_once_with("user1", request)
+        assert discovery._discovered_tables["user1"] is fresh
+
+    def test_cache_evicts_when_full(self):
+        """Past cache_maxsize users, the least recently used one is evicted."""
+        discovery = SnowflakeDiscovery(
+            account="test-account",
+            warehouse="TEST_WH",
+            connection_name="my_conn",
+            cache_maxsize=2,
+        )
+
+        discovery._discovered_tables["user1"] = {}
+        discovery._discovered_tables["user2"] = {}
+        discovery._discovered_tables["user3"] = {}
+
+        assert "user1" not in discovery._discovered_tables
+        assert list(discovery._discovered_tables) == ["user2", "user3"]
+
+        # Reading a user marks it recently used, so user3 goes next
+        discovery._discovered_tables["user2"]
+        discovery._discovered_tables["user4"] = {}
+        assert list(discovery._discovered_tables) == ["user2", "user4"]
+
+    def test_cache_reads_value_and_age_together(self):
+        """get_with_age() returns (value, age), or None once a user is evicted."""
+        discovery = SnowflakeDiscovery(
+            account="test-account",
+            warehouse="TEST_WH",
+            connection_name="my_conn",
+            cache_maxsize=1,
+        )
+        tables: dict = {}
+
+        with patch("ggsql_rest._snowflake.time") as mock_time:
+            mock_time.monotonic.return_value = 1000.0
+            discovery._discovered_tables["user1"] = tables
+            mock_time.monotonic.return_value = 1030.0
+            assert discovery._discovered_tables.get_with_age("user1") == (tables, 30.0)
+
+            discovery._discovered_tables["user2"] = {}
+            assert discovery._discovered_tables.get_with_age("user1") is None
+
 
 class TestGetEngine:
     """Test get_engine() method for query route."""
@@ -316,7 +893,7 @@ class TestGetEngine:
 
         # Pre-populate discovered connections cache
         discovery._discovered_connections["user1"] = {
-            "DB1.PUBLIC": ("DB1", "PUBLIC"),
+            "DB1.PUBLIC": _ConnInfo("DB1", "PUBLIC"),
         }
 
         mock_engine = MagicMock()
@@ -326,6 +903,28 @@ class TestGetEngine:
             assert engine is mock_engine
             discovery._create_engine.assert_called_once()
 
+    def test_get_engine_reuses_cached_engine(self):
+        """Repeat get_engine() calls for a connection share one engine."""
+        discovery = SnowflakeDiscovery(
+            account="test-account",
+            warehouse="TEST_WH",
+            connection_name="my_conn",
+        )
+        request = _make_request({"x-user-id": "user1"})
+        discovery._discovered_connections["user1"] = {
+            "DB1.PUBLIC": _ConnInfo("DB1", "PUBLIC"),
+        }
+
+        with patch("ggsql_rest._snowflake.create_engine") as mock_create_engine:
+            first = discovery.get_engine("DB1.PUBLIC", request)
+            second = discovery.get_engine("DB1.PUBLIC", request)
+
+        assert first is second
+        assert mock_create_engine.call_count == 1
+        kwargs = mock_create_engine.call_args.kwargs
+        assert kwargs["pool_pre_ping"] is True
+        assert kwargs["pool_recycle"] == 3300
+
     def test_get_engine_unknown_connection_raises(self):
         """get_engine() raises KeyError for unknown connection."""
         discovery = SnowflakeDiscovery(
@@ -342,50 +941,124 @@ class TestGetEngine:
             discovery.get_engine("DB1.PUBLIC", request)
 
 
+class TestGetSingleTableSchema:
+    """Test get_single_table_schema() for per-table introspection."""
+
+    def test_serves_from_cached_tables(self):
+        """Tables already fetched by get_tables() need no Snowflake round-trip."""
+        discovery = SnowflakeDiscovery(
+            account="test-account",
+            warehouse="TEST_WH",
+            connection_name="my_conn",
+        )
+        request = _make_request({"x-user-id": "user1"})
+
+        from ggsql_rest._models import ColumnSchema, TableSchema
+        users = TableSchema(
+            table_name="USERS",
+            connection="DB1.PUBLIC",
+            columns=[ColumnSchema(column_name="id", data_type="NUMBER(38,0)")],
+        )
+        discovery._discovered_tables["user1"] = {"DB1.PUBLIC.USERS": users}
+        discovery._discovered_connections["user1"] = {"DB1.PUBLIC": _ConnInfo("DB1", "PUBLIC")}
+
+        with patch.object(discovery, "_create_connection") as mock_create:
+            result = discovery.get_single_table_schema(request, "USERS", "DB1.PUBLIC")
+
+        assert result is users
+        mock_create.assert_not_called()
+
+    def test_queries_uncached_table(self):
+        """Tables missing from the cache are introspected with SHOW COLUMNS."""
+        discovery = SnowflakeDiscovery(
+            account="test-account",
+            warehouse="TEST_WH",
+            connection_name="my_conn",
+        )
+        request = _make_request({"x-user-id": "user1"})
+        discovery._discovered_connections["user1"] = {"DB1.PUBLIC": _ConnInfo("DB1", "PUBLIC")}
+
+        fake_conn = _FakeConn({
+            'SHOW COLUMNS IN TABLE "DB1"."PUBLIC"."USERS"': [
+                ("USERS", "PUBLIC", "id", '{"type":"FIXED","precision":38,"scale":0,"nullable":true}'),
+            ],
+        })
+
+        with patch.object(discovery, "_create_connection", return_value=fake_conn):
+            result = discovery.get_single_table_schema(request, "USERS", "DB1.PUBLIC")
+
+        assert result is not None
+        assert result.connection == "DB1.PUBLIC"
+        assert [(c.column_name, c.data_type) for c in result.columns] == [
+            ("id", "NUMBER(38,0)"),
+        ]
+        assert fake_conn.close_calls == 1
+
+
 class TestParseSnowflakeType:
     """Test Snowflake JSON data_type parsing."""
 
     def test_fixed_type(self):
-        from ggsql_rest._snowflake import _parse_snowflake_type
         assert _parse_snowflake_type('{"type":"FIXED","precision":38,"scale":0,"nullable":true}') == "NUMBER(38,0)"
 
     def test_fixed_with_scale(self):
-        from ggsql_rest._snowflake import _parse_snowflake_type
         assert _parse_snowflake_type('{"type":"FIXED","precision":10,"scale":2,"nullable":true}') == "NUMBER(10,2)"
 
     def test_text_type(self):
-        from ggsql_rest._snowflake import _parse_snowflake_type
         assert _parse_snowflake_type('{"type":"TEXT","length":16777216,"nullable":true,"fixed":false}') == "VARCHAR"
 
     def test_real_type(self):
-        from ggsql_rest._snowflake import _parse_snowflake_type
         assert _parse_snowflake_type('{"type":"REAL","nullable":true}') == "FLOAT"
 
     def test_date_type(self):
-        from ggsql_rest._snowflake import _parse_snowflake_type
         assert _parse_snowflake_type('{"type":"DATE","nullable":true}') == "DATE"
 
     def test_boolean_type(self):
-        from ggsql_rest._snowflake import _parse_snowflake_type
         assert _parse_snowflake_type('{"type":"BOOLEAN","nullable":true}') == "BOOLEAN"
 
     def test_timestamp_types(self):
-        from ggsql_rest._snowflake import _parse_snowflake_type
         assert _parse_snowflake_type('{"type":"TIMESTAMP_NTZ","precision":0,"scale":9,"nullable":true}') == "TIMESTAMP_NTZ"
         assert _parse_snowflake_type('{"type":"TIMESTAMP_LTZ","precision":0,"scale":9,"nullable":true}') == "TIMESTAMP_LTZ"
 
     def test_variant_type(self):
-        from ggsql_rest._snowflake import _parse_snowflake_type
         assert _parse_snowflake_type('{"type":"VARIANT","nullable":true}') == "VARIANT"
 
     def test_invalid_json_returns_varchar(self):
-        from ggsql_rest._snowflake import _parse_snowflake_type
         assert _parse_snowflake_type("not-json") == "VARCHAR"
 
+    def test_truncated_fixed_falls_back_to_varchar(self):
+        assert _parse_snowflake_type('{"type":"FIXED","precision":') == "VARCHAR"
+
+    def test_parse_snowflake_type_is_cached(self):
+        _parse_snowflake_type.cache_clear()
+        data_type = '{"type":"FIXED","precision":12,"scale":4,"nullable":false}'
+        assert _parse_snowflake_type(data_type) == "NUMBER(12,4)"
+        assert _parse_snowflake_type(data_type) == "NUMBER(12,4)"
+        assert _parse_snowflake_type.cache_info().hits == 1
+
+    def test_fixed_parses_without_json(self):
+        with patch("ggsql_rest._snowflake.orjson.loads") as mock_loads:
+            result = _parse_snowflake_type('{"type":"FIXED","precision":18,"scale":3,"nullable":true}')
+        assert result == "NUMBER(18,3)"
+        mock_loads.assert_not_called()
+
+    def test_key_order_independent(self):
+        assert _parse_snowflake_type('{"nullable":true,"type":"TEXT"}') == "VARCHAR"
+        assert _parse_snowflake_type('{"scale":2,"type":"FIXED","precision":10}') == "NUMBER(10,2)"
+
     def test_missing_type_key(self):
-        from ggsql_rest._snowflake import _parse_snowflake_type
         assert _parse_snowflake_type('{"nullable":true}') == "VARCHAR"
 
+    def test_nested_type_keys_ignored(self):
+        structured = '{"fields":[{"fieldName":"a","fieldType":{"type":"FIXED","precision":38,"scale":0}}],"type":"OBJECT"}'
+        vector = '{"vectorElementType":{"type":"REAL"},"type":"VECTOR","vectorDimension":3}'
+        assert _parse_snowflake_type(structured) == "OBJECT"
+        assert _parse_snowflake_type(vector) == "VECTOR"
+
+    def test_non_object_json_returns_varchar(self):
+        assert _parse_snowflake_type('["FIXED"]') == "VARCHAR"
+        assert _parse_snowflake_type('{"type":{"type":"FIXED"}}') == "VARCHAR"
+
 
 class TestGetTableNames:
     """Test get_table_names() method for fast table name discovery."""
@@ -399,35 +1072,16 @@ class TestGetTableNames:
         )
         request = _make_request({"x-user-id": "user1"})
 
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_conn.cursor.return_value = mock_cursor
-
-        call_count = {"fetchall": 0}
-
-        def fetchall_side_effect():
-            call_count["fetchall"] += 1
-            if call_count["fetchall"] == 1:
-                # SHOW DATABASES
-                return [("created_on", "DB1", "owner", "comment", "options", "retention_time")]
-            elif call_count["fetchall"] == 2:
-                # SHOW SCHEMAS IN DATABASE "DB1"
-                return [("created_on", "PUBLIC", "database", "owner", "comment", "options")]
-            elif call_count["fetchall"] == 3:
-                # SHOW TABLES IN SCHEMA "DB1"."PUBLIC"
-                return [
-                    ("created_on", "USERS", "database", "schema", "kind", "comment"),
-                    ("created_on", "ORDERS", "database", "schema", "kind", "comment"),
-                ]
-            raise ValueError(f"Unexpected fetchall call #{call_count['fetchall']}")
-
-        mock_cursor.fetchall.side_effect = fetchall_side_effect
-
-        with patch.object(discovery, "_create_connection", return_value=mock_conn):
+        fake_conn = _FakeConn({
+            "SHOW DATABASES": _db_rows("DB1"),
+            'SHOW TERSE TABLES IN DATABASE "DB1"': _table_rows("PUBLIC", "USERS", "ORDERS"),
+        })
+
+        with patch.object(discovery, "_create_connection", return_value=fake_conn):
             result = discovery.get_table_names(request)
 
-        # Should close the connection
-        mock_conn.close.assert_called_once()
+        # The pooled connection stays open for the next request
+        assert fake_conn.close_calls == 0
 
         # Should return (table_name, connection_name) tuples
         assert len(result) == 2
@@ -436,7 +1090,7 @@ class TestGetTableNames:
 
         # Should populate _discovered_connections cache
         assert "user1" in discovery._discovered_connections
-        assert discovery._discovered_connections["user1"] == {"DB1.PUBLIC": ("DB1", "PUBLIC")}
+        assert discovery._discovered_connections["user1"] == {"DB1.PUBLIC": _ConnInfo("DB1", "PUBLIC")}
 
     def test_caches_results(self):
         """Second call to get_table_names() uses cache without re-querying."""
@@ -452,7 +1106,7 @@ class TestGetTableNames:
             ("DB1.PUBLIC", "DB1", "PUBLIC", "USERS"),
             ("DB1.PUBLIC", "DB1", "PUBLIC", "ORDERS"),
         ]
-        discovery._discovered_connections["user1"] = {"DB1.PUBLIC": ("DB1", "PUBLIC")}
+        discovery._discovered_connections["user1"] = {"DB1.PUBLIC": _ConnInfo("DB1", "PUBLIC")}
 
         with patch.object(discovery, "_create_connection") as mock_create:
             result = discovery.get_table_names(request)
@@ -465,45 +1119,160 @@ class TestGetTableNames:
         assert ("USERS", "DB1.PUBLIC") in result
         assert ("ORDERS", "DB1.PUBLIC") in result
 
-    def test_uses_databases_filter(self):
-        """get_table_names() respects databases filter and skips SHOW DATABASES."""
+    def test_cached_catalog_restores_evicted_connections(self):
+        """Connections evicted by other users are rebuilt from the cached catalog."""
         discovery = SnowflakeDiscovery(
             account="test-account",
             warehouse="TEST_WH",
             connection_name="my_conn",
-            databases=["MYDB"],
+            cache_maxsize=2,
         )
         request = _make_request({"x-user-id": "user1"})
+        discovery._cache_catalog("user1", [("DB1.PUBLIC", "DB1", "PUBLIC", "USERS")])
 
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_conn.cursor.return_value = mock_cursor
+        # Other users' get_tables() calls evict user1's connections only
+        discovery._discovered_connections["user2"] = {}
+        discovery._discovered_connections["user3"] = {}
+        assert "user1" not in discovery._discovered_connections
 
-        call_count = {"fetchall": 0}
+        assert discovery.has_connection("DB1.PUBLIC", request)
+        del discovery._discovered_connections["user1"]
+        with patch.object(discovery, "_create_connection") as mock_create:
+            assert discovery.get_table_names(request) == [("USERS", "DB1.PUBLIC")]
+        mock_create.assert_not_called()
+        with patch.object(discovery, "_create_engine") as mock_engine:
+            assert discovery.get_engine("DB1.PUBLIC", request) is mock_engine.return_value
 
-        def fetchall_side_effect():
-            call_count["fetchall"] += 1
-            if call_count["fetchall"] == 1:
-                # SHOW SCHEMAS IN DATABASE "MYDB" (no SHOW DATABASES call)
-                return [("created_on", "PUBLIC", "database", "owner", "comment", "options")]
-            elif call_count["fetchall"] == 2:
-                # SHOW TABLES IN SCHEMA "MYDB"."PUBLIC"
-                return [("created_on", "CUSTOMERS", "database", "schema", "kind", "comment")]
-            raise ValueError(f"Unexpected fetchall call #{call_count['fetchall']}")
+    def test_uses_databases_filter(self):
+        """get_table_names() respects databases filter and skips SHOW DATABASES."""
+        discovery = SnowflakeDiscovery(
+            account="test-account",
+            warehouse="TEST_WH",
+            connection_name="my_conn",
+            databases=["MYDB"],
+        )
+        request = _make_request({"x-user-id": "user1"})
 
-        mock_cursor.fetchall.side_effect = fetchall_side_effect
+        # No SHOW DATABASES entry: the databases filter must skip it
+        fake_conn = _FakeConn({
+            'SHOW TERSE TABLES IN DATABASE "MYDB"': _table_rows("PUBLIC", "CUSTOMERS"),
+        })
 
-        with patch.object(discovery, "_create_connection", return_value=mock_conn):
+        with patch.object(discovery, "_create_connection", return_value=fake_conn):
             result = discovery.get_table_names(request)
 
         # Should not have called SHOW DATABASES
-        execute_calls = [str(call) for call in mock_cursor.execute.call_args_list]
-        assert not any("SHOW DATABASES" in str(call) for call in execute_calls)
+        assert "SHOW DATABASES" not in fake_conn.queries
 
         # Should return result using specified database
         assert len(result) == 1
         assert ("CUSTOMERS", "MYDB.PUBLIC") in result
 
+    def test_discover_catalog_uses_disk_cache(self, tmp_path):
+        """A fresh instance sharing cache_dir reuses the catalog until it expires."""
+        request = _make_request({"x-user-id": "user1"})
+        fake_conn = _FakeConn({
+            "SHOW DATABASES": _db_rows("DB1"),
+            'SHOW TERSE TABLES IN DATABASE "DB1"': _table_rows("PUBLIC", "USERS"),
+        })
+
+        def new_discovery() -> SnowflakeDiscovery:
+            return SnowflakeDiscovery(
+                account="test-account",
+                warehouse="TEST_WH",
+                connection_name="my_conn",
+                cache_dir=tmp_path,
+            )
+
+        discovery = new_discovery()
+        with patch.object(discovery, "_create_connection", return_value=fake_conn):
+            expected = discovery.get_table_names(request)
+        (cache_file,) = tmp_path.glob("catalog-*.json")
+
+        # Cold start: served from disk, connections registered, no Snowflake login
+        discovery = new_discovery()
+        with patch.object(discovery, "_create_connection") as mock_create:
+            assert discovery.get_table_names(request) == expected
+        mock_create.assert_not_called()
+        assert discovery.has_connection("DB1.PUBLIC", request)
+
+        # Other users get their own file
+        discovery = new_discovery()
+        with patch.object(discovery, "_create_connection", return_value=fake_conn):
+            discovery.get_table_names(_make_request({"x-user-id": "user2"}))
+        assert len(list(tmp_path.glob("catalog-*.json"))) == 2
+
+        # An hour-old file is ignored and rediscovered
+        os.utime(cache_file, (0, 0))
+        discovery = new_discovery()
+        with patch.object(
+            discovery, "_create_connection", return_value=fake_conn
+        ) as mock_create:
+            assert discovery.get_table_names(request) == expected
+        mock_create.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "contents",
+        [b'{"DB1.PUBLIC": []}', b"[1, 2]", b'[["DB1.PUBLIC", "DB1", "USERS"]]', b'[[1, 2, 3, 4]]'],
+    )
+    def test_disk_cache_with_wrong_shape_is_rediscovered(self, tmp_path, contents):
+        """A cache file holding valid JSON of the wrong shape is treated as a miss."""
+        request = _make_request({"x-user-id": "user1"})
+        discovery = SnowflakeDiscovery(
+            account="test-account",
+            warehouse="TEST_WH",
+            connection_name="my_conn",
+            cache_dir=tmp_path,
+        )
+        path = discovery._disk_catalog_path("user1")
+        assert path is not None
+        path.write_bytes(contents)
+        fake_conn = _FakeConn({
+            "SHOW DATABASES": _db_rows("DB1"),
+            'SHOW TERSE TABLES IN DATABASE "DB1"': _table_rows("PUBLIC", "USERS"),
+        })
+
+        with patch.object(discovery, "_create_connection", return_value=fake_conn):
+            assert discovery.get_table_names(request) == [("USERS", "DB1.PUBLIC")]
+
+    def test_uses_schemas_filter(self):
+        """get_table_names() lists only configured schemas, skipping SHOW DATABASES/SCHEMAS."""
+        discovery = SnowflakeDiscovery(
+            account="test-account",
+            warehouse="TEST_WH",
+            connection_name="my_conn",
+            schemas=["MYDB.SALES", "MYDB.MARKETING", "OTHER.PUBLIC"],
+        )
+        request = _make_request({"x-user-id": "user1"})
+
+        # Only per-schema SHOW TABLES entries: everything else must be skipped
+        fake_conn = _FakeConn({
+            'SHOW TERSE TABLES IN SCHEMA "MYDB"."SALES"': _table_rows("SALES", "ORDERS"),
+            'SHOW TERSE TABLES IN SCHEMA "MYDB"."MARKETING"': _table_rows("MARKETING", "LEADS"),
+            'SHOW TERSE TABLES IN SCHEMA "OTHER"."PUBLIC"': _table_rows("PUBLIC", "T"),
+        })
+
+        with patch.object(discovery, "_create_connection", return_value=fake_conn):
+            result = discovery.get_table_names(request)
+
+        assert not any(
+            q.startswith(("SHOW DATABASES", "SHOW TERSE SCHEMAS")) for q in fake_conn.queries
+        )
+        assert sorted(result) == [
+            ("LEADS", "MYDB.MARKETING"),
+            ("ORDERS", "MYDB.SALES"),
+            ("T", "OTHER.PUBLIC"),
+        ]
+
+    def test_invalid_schemas_filter_raises(self):
+        """Schema filter entries must be qualified with their database."""
+        with pytest.raises(ValueError, match="DATABASE.SCHEMA"):
+            SnowflakeDiscovery(
+                account="test-account",
+                warehouse="TEST_WH",
+                schemas=["PUBLIC"],
+            )
+
 
 class TestStreamTableNames:
     """Test stream_table_names() generator method for streaming discovery."""
@@ -517,58 +1286,30 @@ class TestStreamTableNames:
         )
         request = _make_request({"x-user-id": "user1"})
 
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_conn.cursor.return_value = mock_cursor
-
-        call_count = {"fetchall": 0}
-
-        def fetchall_side_effect():
-            call_count["fetchall"] += 1
-            if call_count["fetchall"] == 1:
-                # SHOW DATABASES
-                return [
-                    ("created_on", "DB1", "owner", "comment", "options", "retention_time"),
-                    ("created_on", "DB2", "owner", "comment", "options", "retention_time"),
-                ]
-            elif call_count["fetchall"] == 2:
-                # SHOW SCHEMAS IN DATABASE "DB1"
-                return [("created_on", "PUBLIC", "database", "owner", "comment", "options")]
-            elif call_count["fetchall"] == 3:
-                # SHOW TABLES IN SCHEMA "DB1"."PUBLIC"
-                return [
-                    ("created_on", "USERS", "database", "schema", "kind", "comment"),
-                    ("created_on", "ORDERS", "database", "schema", "kind", "comment"),
-                ]
-            elif call_count["fetchall"] == 4:
-                # SHOW SCHEMAS IN DATABASE "DB2"
-                return [("created_on", "PUBLIC", "database", "owner", "comment", "options")]
-            elif call_count["fetchall"] == 5:
-                # SHOW TABLES IN SCHEMA "DB2"."PUBLIC"
-                return [("created_on", "PRODUCTS", "database", "schema", "kind", "comment")]
-            raise ValueError(f"Unexpected fetchall call #{call_count['fetchall']}")
-
-        mock_cursor.fetchall.side_effect = fetchall_side_effect
-
-        with patch.object(discovery, "_create_connection", return_value=mock_conn):
+        fake_conn = _FakeConn({
+            "SHOW DATABASES": _db_rows("DB1", "DB2"),
+            'SHOW TERSE TABLES IN DATABASE "DB1"': _table_rows("PUBLIC", "USERS", "ORDERS"),
+            'SHOW TERSE TABLES IN DATABASE "DB2"': _table_rows("PUBLIC", "PRODUCTS"),
+        })
+
+        with patch.object(discovery, "_create_connection", return_value=fake_conn):
             results = list(discovery.stream_table_names(request))
 
-        # Should yield per-database results
+        # Should yield per-database results, in completion order
         assert len(results) == 2
-        db1_name, db1_tables = results[0]
-        db2_name, db2_tables = results[1]
+        by_db = dict(results)
 
-        assert db1_name == "DB1"
+        db1_tables = by_db["DB1"]
         assert len(db1_tables) == 2
         assert ("USERS", "DB1.PUBLIC") in db1_tables
         assert ("ORDERS", "DB1.PUBLIC") in db1_tables
 
-        assert db2_name == "DB2"
+        db2_tables = by_db["DB2"]
         assert len(db2_tables) == 1
         assert ("PRODUCTS", "DB2.PUBLIC") in db2_tables
 
-        # Should close the connection
-        mock_conn.close.assert_called_once()
+        # The pooled connection stays open for the next request
+        assert fake_conn.close_calls == 0
 
     def test_registers_connections_incrementally(self):
         """Connections are registered before each yield so they're queryable mid-stream."""
@@ -579,88 +1320,75 @@ class TestStreamTableNames:
         )
         request = _make_request({"x-user-id": "user1"})
 
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_conn.cursor.return_value = mock_cursor
-
-        call_count = {"fetchall": 0}
-
-        def fetchall_side_effect():
-            call_count["fetchall"] += 1
-            if call_count["fetchall"] == 1:
-                # SHOW DATABASES
-                return [
-                    ("created_on", "DB1", "owner", "comment", "options", "retention_time"),
-                    ("created_on", "DB2", "owner", "comment", "options", "retention_time"),
-                ]
-            elif call_count["fetchall"] == 2:
-                # SHOW SCHEMAS IN DATABASE "DB1"
-                return [("created_on", "PUBLIC", "database", "owner", "comment", "options")]
-            elif call_count["fetchall"] == 3:
-                # SHOW TABLES IN SCHEMA "DB1"."PUBLIC"
-                return [("created_on", "USERS", "database", "schema", "kind", "comment")]
-            elif call_count["fetchall"] == 4:
-                # SHOW SCHEMAS IN DATABASE "DB2"
-                return [("created_on", "PUBLIC", "database", "owner", "comment", "options")]
-            elif call_count["fetchall"] == 5:
-                # SHOW TABLES IN SCHEMA "DB2"."PUBLIC"
-                return [("created_on", "PRODUCTS", "database", "schema", "kind", "comment")]
-            raise ValueError(f"Unexpected fetchall call #{call_count['fetchall']}")
-
-        mock_cursor.fetchall.side_effect = fetchall_side_effect
-
-        with patch.object(discovery, "_create_connection", return_value=mock_conn):
+        fake_conn = _FakeConn({
+            "SHOW DATABASES": _db_rows("DB1", "DB2"),
+            'SHOW TERSE TABLES IN DATABASE "DB1"': _table_rows("PUBLIC", "USERS"),
+            'SHOW TERSE TABLES IN DATABASE "DB2"': _table_rows("PUBLIC", "PRODUCTS"),
+        })
+
+        with patch.object(discovery, "_create_connection", return_value=fake_conn):
             gen = discovery.stream_table_names(request)
 
             # Before any iteration, no connections registered
             assert "user1" not in discovery._discovered_connections
 
-            # After first yield (DB1), DB1.PUBLIC should be registered
-            next(gen)
+            # After the first yield, only that database's connection is registered
+            first_db, _ = next(gen)
+            second_db = "DB2" if first_db == "DB1" else "DB1"
             assert "user1" in discovery._discovered_connections
-            assert "DB1.PUBLIC" in discovery._discovered_connections["user1"]
-            assert "DB2.PUBLIC" not in discovery._discovered_connections["user1"]
+            assert f"{first_db}.PUBLIC" in discovery._discovered_connections["user1"]
+            assert f"{second_db}.PUBLIC" not in discovery._discovered_connections["user1"]
 
-            # DB1.PUBLIC is now queryable via get_engine (would work if called)
-            assert discovery.has_connection("DB1.PUBLIC", request)
-            assert not discovery.has_connection("DB2.PUBLIC", request)
+            # It is now queryable via get_engine (would work if called)
+            assert discovery.has_connection(f"{first_db}.PUBLIC", request)
+            assert not discovery.has_connection(f"{second_db}.PUBLIC", request)
 
-            # After second yield (DB2), both should be registered
+            # After the second yield, both should be registered
             next(gen)
-            assert "DB2.PUBLIC" in discovery._discovered_connections["user1"]
-            assert discovery.has_connection("DB2.PUBLIC", request)
+            assert f"{second_db}.PUBLIC" in discovery._discovered_connections["user1"]
+            assert discovery.has_connection(f"{second_db}.PUBLIC", request)
 
-    def test_populates_cache_after_full_iteration(self):
-        """Consuming the full generator populates the cache."""
+    def test_yields_databases_as_they_complete(self):
+        """A slow database does not hold back databases that finish first."""
         discovery = SnowflakeDiscovery(
             account="test-account",
             warehouse="TEST_WH",
             connection_name="my_conn",
         )
         request = _make_request({"x-user-id": "user1"})
+        db2_received = threading.Event()
+
+        def slow_db1_tables() -> list[tuple]:
+            assert db2_received.wait(timeout=5)
+            return _table_rows("PUBLIC", "USERS")
 
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_conn.cursor.return_value = mock_cursor
+        fake_conn = _FakeConn({
+            "SHOW DATABASES": _db_rows("DB1", "DB2"),
+            'SHOW TERSE TABLES IN DATABASE "DB1"': slow_db1_tables,
+            'SHOW TERSE TABLES IN DATABASE "DB2"': _table_rows("PUBLIC", "PRODUCTS"),
+        })
 
-        call_count = {"fetchall": 0}
+        with patch.object(discovery, "_create_connection", return_value=fake_conn):
+            gen = discovery.stream_table_names(request)
+            assert next(gen)[0] == "DB2"
+            db2_received.set()
+            assert next(gen)[0] == "DB1"
 
-        def fetchall_side_effect():
-            call_count["fetchall"] += 1
-            if call_count["fetchall"] == 1:
-                # SHOW DATABASES
-                return [("created_on", "DB1", "owner", "comment", "options", "retention_time")]
-            elif call_count["fetchall"] == 2:
-                # SHOW SCHEMAS IN DATABASE "DB1"
-                return [("created_on", "PUBLIC", "database", "owner", "comment", "options")]
-            elif call_count["fetchall"] == 3:
-                # SHOW TABLES IN SCHEMA "DB1"."PUBLIC"
-                return [("created_on", "USERS", "database", "schema", "kind", "comment")]
-            raise ValueError(f"Unexpected fetchall call #{call_count['fetchall']}")
+    def test_populates_cache_after_full_iteration(self):
+        """Consuming the full generator populates the cache."""
+        discovery = SnowflakeDiscovery(
+            account="test-account",
+            warehouse="TEST_WH",
+            connection_name="my_conn",
+        )
+        request = _make_request({"x-user-id": "user1"})
 
-        mock_cursor.fetchall.side_effect = fetchall_side_effect
+        fake_conn = _FakeConn({
+            "SHOW DATABASES": _db_rows("DB1"),
+            'SHOW TERSE TABLES IN DATABASE "DB1"': _table_rows("PUBLIC", "USERS"),
+        })
 
-        with patch.object(discovery, "_create_connection", return_value=mock_conn):
+        with patch.object(discovery, "_create_connection", return_value=fake_conn):
             # Consume the full generator
             _ = list(discovery.stream_table_names(request))
 
@@ -672,7 +1400,7 @@ class TestStreamTableNames:
 
         # Should populate connections cache
         assert "user1" in discovery._discovered_connections
-        assert discovery._discovered_connections["user1"] == {"DB1.PUBLIC": ("DB1", "PUBLIC")}
+        assert discovery._discovered_connections["user1"] == {"DB1.PUBLIC": _ConnInfo("DB1", "PUBLIC")}
 
     def test_uses_cache_on_second_call(self):
         """Second call to stream_table_names() uses cache without re-querying."""
@@ -690,8 +1418,8 @@ class TestStreamTableNames:
             ("DB2.PUBLIC", "DB2", "PUBLIC", "PRODUCTS"),
         ]
         discovery._discovered_connections["user1"] = {
-            "DB1.PUBLIC": ("DB1", "PUBLIC"),
-            "DB2.PUBLIC": ("DB2", "PUBLIC"),
+            "DB1.PUBLIC": _ConnInfo("DB1", "PUBLIC"),
+            "DB2.PUBLIC": _ConnInfo("DB2", "PUBLIC"),
         }
 
         with patch.object(discovery, "_create_connection") as mock_create:
@@ -704,21 +1432,14 @@ class TestStreamTableNames:
         assert len(results) == 2
 
         # Results should be grouped by database
-        db_names = {db_name for db_name, _ in results}
-        assert db_names == {"DB1", "DB2"}
-
-        # Find DB1 and DB2 results
-        db1_result = next((tables for db_name, tables in results if db_name == "DB1"), None)
-        db2_result = next((tables for db_name, tables in results if db_name == "DB2"), None)
+        by_db = dict(results)
+        assert set(by_db) == {"DB1", "DB2"}
 
-        assert db1_result is not None
-        assert len(db1_result) == 2
-        assert ("USERS", "DB1.PUBLIC") in db1_result
-        assert ("ORDERS", "DB1.PUBLIC") in db1_result
+        assert len(by_db["DB1"]) == 2
+        assert ("USERS", "DB1.PUBLIC") in by_db["DB1"]
+        assert ("ORDERS", "DB1.PUBLIC") in by_db["DB1"]
 
-        assert db2_result is not None
-        assert len(db2_result) == 1
-        assert ("PRODUCTS", "DB2.PUBLIC") in db2_result
+        assert by_db["DB2"] == [("PRODUCTS", "DB2.PUBLIC")]
 
     def test_skips_empty_databases(self):
         """Databases with no tables (after filtering INFORMATION_SCHEMA) are not yielded."""
@@ -729,34 +1450,13 @@ class TestStreamTableNames:
         )
         request = _make_request({"x-user-id": "user1"})
 
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_conn.cursor.return_value = mock_cursor
-
-        call_count = {"fetchall": 0}
-
-        def fetchall_side_effect():
-            call_count["fetchall"] += 1
-            if call_count["fetchall"] == 1:
-                # SHOW DATABASES
-                return [
-                    ("created_on", "DB1", "owner", "comment", "options", "retention_time"),
-                    ("created_on", "EMPTY_DB", "owner", "comment", "options", "retention_time"),
-                ]
-            elif call_count["fetchall"] == 2:
-                # SHOW SCHEMAS IN DATABASE "DB1"
-                return [("created_on", "PUBLIC", "database", "owner", "comment", "options")]
-            elif call_count["fetchall"] == 3:
-                # SHOW TABLES IN SCHEMA "DB1"."PUBLIC"
-                return [("created_on", "USERS", "database", "schema", "kind", "comment")]
-            elif call_count["fetchall"] == 4:
-                # SHOW SCHEMAS IN DATABASE "EMPTY_DB"
-                return [("created_on", "INFORMATION_SCHEMA", "database", "owner", "comment", "options")]
-            raise ValueError(f"Unexpected fetchall call #{call_count['fetchall']}")
-
-        mock_cursor.fetchall.side_effect = fetchall_side_effect
-
-        with patch.object(discovery, "_create_connection", return_value=mock_conn):
+        fake_conn = _FakeConn({
+            "SHOW DATABASES": _db_rows("DB1", "EMPTY_DB"),
+            'SHOW TERSE TABLES IN DATABASE "DB1"': _table_rows("PUBLIC", "USERS"),
+            'SHOW TERSE TABLES IN DATABASE "EMPTY_DB"': _table_rows("INFORMATION_SCHEMA", "TABLES"),
+        })
+
+        with patch.object(discovery, "_create_connection", return_value=fake_conn):
             results = list(discovery.stream_table_names(request))
 
         # Should only yield DB1, not EMPTY_DB
@@ -765,3 +1465,28 @@ class TestStreamTableNames:
         assert db_name == "DB1"
         assert len(tables) == 1
         assert ("USERS", "DB1.PUBLIC") in tables
+
+    def test_streams_account_objects_per_database(self):
+        """The account-wide SHOW is streamed as one batch per database."""
+        discovery = SnowflakeDiscovery(
+            account="test-account",
+            warehouse="TEST_WH",
+            connection_name="my_conn",
+        )
+        request = _make_request({"x-user-id": "user1"})
+
+        fake_conn = _FakeConn({
+            "SHOW TERSE OBJECTS IN ACCOUNT": [
+                ("created_on", "ORDERS", "TABLE", "DB2", "SALES"),
+                ("created_on", "USERS", "TABLE", "DB1", "PUBLIC"),
+            ],
+        })
+
+        with patch.object(discovery, "_create_connection", return_value=fake_conn):
+            results = list(discovery.stream_table_names(request))
+
+        assert results == [
+            ("DB1", [("USERS", "DB1.PUBLIC")]),
+            ("DB2", [("ORDERS", "DB2.SALES")]),
+        ]
+        assert "SHOW DATABASES" not in fake_conn.queries